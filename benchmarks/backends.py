@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Compares the execution backends on the loop of `examples/parallel_for.py`, a sum reduction over a range.
+
+Each backend runs the loop with each number of threads, after a first run which starts its workers. The thread
+backend is limited by the GIL, while the process and interpreter backends run the members of a team in parallel.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples'))
+
+import omp  # noqa: E402
+import results  # noqa: E402
+from parallel_for import parallel_sum  # noqa: E402
+
+
+def available_backends():
+    backends = []
+    for backend in omp.core.primitives.backends:
+        try:
+            omp.set_backend(backend)
+        except ValueError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+def run(backends, thread_counts, n, repeat):
+    """
+    Return the time taken by each backend and number of threads: see `results`.
+    """
+    measured = []
+    for backend in backends:
+        omp.set_backend(backend)
+        for threads in thread_counts:
+            omp.set_num_threads(threads)
+            parallel_sum(threads)
+
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                parallel_sum(n)
+                best = min(best, time.perf_counter() - start)
+            measured.append(results.result('backend', {'backend': backend, 'threads': threads}, best))
+
+    omp.set_backend('thread')
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backends', nargs='+', choices=omp.core.primitives.backends, default=available_backends())
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('-n', type=int, default=10000000, help='number of iterations of the loop')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    measured = run(args.backends, args.threads, args.n, args.repeat)
+
+    print(f'{"backend":<14}{"threads":>8}{"seconds":>12}')
+    for entry in measured:
+        print(f'{entry["params"]["backend"]:<14}{entry["params"]["threads"]:>8}{entry["seconds"]:>12.4f}')
+
+    if args.output:
+        results.write(args.output, 'backends', measured)
+
+
+if __name__ == '__main__':
+    main()
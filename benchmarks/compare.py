@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compares two benchmark results files, such as the results of two commits, and reports the regressions.
+
+A measurement regresses when it takes longer than in the baseline by more than the threshold, relative to the
+baseline, and more than the absolute tolerance. Exits with status 1 when a measurement regresses.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import results  # noqa: E402
+
+
+def compare(baseline, current, threshold, tolerance):
+    """
+    Return the measurements found in both results, as `(name, params, baseline, current, regressed)` tuples.
+    """
+    baseline_results = {results.key(entry): entry for entry in baseline['results']}
+
+    compared = []
+    for entry in current['results']:
+        previous = baseline_results.get(results.key(entry))
+        if previous is None:
+            continue
+        before, after = previous['seconds'], entry['seconds']
+        regressed = after - before > max(threshold * abs(before), tolerance)
+        compared.append((entry['name'], entry['params'], before, after, regressed))
+    return compared
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative slowdown to report, 0.1 for 10%%')
+    parser.add_argument('--tolerance', type=float, default=1e-6, help='absolute slowdown to report, in seconds')
+    args = parser.parse_args()
+
+    baseline, current = results.load(args.baseline), results.load(args.current)
+    if baseline['suite'] != current['suite']:
+        parser.error(f'Cannot compare results of the {baseline["suite"]} and {current["suite"]} suites.')
+
+    compared = compare(baseline, current, args.threshold, args.tolerance)
+
+    print(f'{"benchmark":<14}{"params":<32}{"baseline (us)":>15}{"current (us)":>15}{"change":>9}')
+    for name, params, before, after, regressed in compared:
+        change = f'{(after - before) / abs(before):+.0%}' if before else ''
+        description = ' '.join(f'{key}={value}' for key, value in params.items())
+        print(f'{name:<14}{description:<32}{before * 1e6:>15.2f}{after * 1e6:>15.2f}{change:>9}'
+              f'{"  regression" if regressed else ""}')
+
+    regressions = sum(regressed for *_, regressed in compared)
+    print(f'{regressions} regression(s) out of {len(compared)} measurement(s).')
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
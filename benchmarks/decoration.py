@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Measures the time taken by `@omp.enable` to transform functions of increasing size.
+
+Two shapes of functions are generated: `sequential` functions contain n `parallel for` constructs one after the other,
+and `nested` functions contain n constructs nested in each other.
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import textwrap
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import omp  # noqa: E402
+import results  # noqa: E402
+
+
+def sequential(n):
+    blocks = ''.join(f"""
+    with OpenMP("parallel for reduction(+:acc) schedule(dynamic, 4)"):
+        for i{k} in range(100):
+            acc += i{k}
+            tmp{k} = acc * 2
+""" for k in range(n))
+    return f"""
+def main():
+    acc = 0
+{textwrap.indent(textwrap.dedent(blocks), '    ')}
+    return acc
+"""
+
+
+def nested(n):
+    body = 'acc += 1'
+    for k in reversed(range(n)):
+        directive = ('parallel', 'single', 'critical')[k % 3]
+        body = f'with OpenMP("{directive}"):\n    x{k} = {k}\n' + textwrap.indent(body, '    ')
+    return f"""
+def main():
+    acc = 0
+{textwrap.indent(body, '    ')}
+    return acc
+"""
+
+
+SHAPES = {'sequential': sequential, 'nested': nested}
+
+
+def measure(directory, name, source, decorated, repeat):
+    """
+    Return the best time to import a module defining the given function, decorated or not.
+    """
+    header = 'import omp\nfrom omp import OpenMP\n'
+    with open(os.path.join(directory, f'{name}.py'), 'w') as file:
+        file.write(header + source.replace('def main', '@omp.enable\ndef main' if decorated else 'def main'))
+
+    best = float('inf')
+    for _ in range(repeat):
+        sys.modules.pop(name, None)
+        importlib.invalidate_caches()
+        start = time.perf_counter()
+        importlib.import_module(name)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeat):
+    """
+    Return the decoration time of each shape and size: see `results`.
+    """
+    omp.core.cache.enabled = False
+    sys.dont_write_bytecode = True
+
+    measured = []
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        try:
+            for shape, generate in SHAPES.items():
+                for size in sizes:
+                    source = generate(size)
+                    name = f'omp_bench_{shape}_{size}'
+                    decorated = measure(directory, f'{name}_enabled', source, True, repeat)
+                    plain = measure(directory, f'{name}_plain', source, False, repeat)
+                    measured.append(results.result('decoration', {'shape': shape, 'size': size}, decorated - plain))
+        finally:
+            sys.path.remove(directory)
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    measured = run(args.sizes, args.repeat)
+
+    print(f'{"shape":<12}{"size":>6}{"ms":>12}')
+    for entry in measured:
+        print(f'{entry["params"]["shape"]:<12}{entry["params"]["size"]:>6}{entry["seconds"] * 1000:>12.2f}')
+
+    if args.output:
+        results.write(args.output, 'decoration', measured)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Measures the overhead of the OpenMP constructs, in the manner of the EPCC OpenMP microbenchmarks.
+
+Each construct encloses a fixed amount of work, a delay loop, and is run many times in a row. The overhead of the
+construct is the difference between that time and the time to run the same delays serially, divided by the number of
+repetitions. The synchronization benchmarks cover `parallel`, `for`, `parallel for`, `barrier`, `single`, `critical`
+and `parallel for` with a reduction; the scheduling benchmarks cover a `for` loop of a fixed number of iterations per
+thread with each schedule kind and chunk size.
+"""
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import omp  # noqa: E402
+import results  # noqa: E402
+
+HEADER = """
+import omp
+from omp import OpenMP
+
+
+def delay(length):
+    a = 0.0
+    for i in range(length):
+        a += i
+    return a
+
+
+def reference(reps, length, threads, iterations):
+    for j in range(reps):
+        delay(length)
+"""
+
+# Each benchmark runs `reps` repetitions of its construct, and as many delays as `reps` serial repetitions of the
+# reference.
+SYNCHRONIZATION = {
+    'parallel': """
+@omp.enable
+def parallel(reps, length, threads, iterations):
+    for j in range(reps):
+        with OpenMP("parallel"):
+            delay(length)
+""",
+    'for': """
+@omp.enable
+def for_(reps, length, threads, iterations):
+    with OpenMP("parallel private(j)"):
+        for j in range(reps):
+            with OpenMP("for schedule(static)"):
+                for i in range(threads):
+                    delay(length)
+""",
+    'parallel for': """
+@omp.enable
+def parallel_for(reps, length, threads, iterations):
+    for j in range(reps):
+        with OpenMP("parallel for schedule(static)"):
+            for i in range(threads):
+                delay(length)
+""",
+    'barrier': """
+@omp.enable
+def barrier(reps, length, threads, iterations):
+    with OpenMP("parallel private(j)"):
+        for j in range(reps):
+            delay(length)
+            OpenMP("barrier")
+""",
+    'single': """
+@omp.enable
+def single(reps, length, threads, iterations):
+    with OpenMP("parallel private(j)"):
+        for j in range(reps):
+            with OpenMP("single"):
+                delay(length)
+""",
+    'critical': """
+@omp.enable
+def critical(reps, length, threads, iterations):
+    with OpenMP("parallel private(j)"):
+        for j in range(reps // threads):
+            with OpenMP("critical"):
+                delay(length)
+""",
+    'reduction': """
+@omp.enable
+def reduction(reps, length, threads, iterations):
+    for j in range(reps):
+        total = 0
+        with OpenMP("parallel for reduction(+:total) schedule(static)"):
+            for i in range(threads):
+                delay(length)
+                total += 1
+""",
+}
+
+# Each repetition of the scheduling benchmarks runs `iterations` delays on each thread, without a barrier between the
+# repetitions, as many as `reps * iterations` serial repetitions of the reference.
+SCHEDULING = """
+@omp.enable
+def {function}(reps, length, threads, iterations):
+    with OpenMP("parallel private(j)"):
+        for j in range(reps):
+            with OpenMP("for schedule({schedule}) nowait"):
+                for i in range(iterations * threads):
+                    delay(length)
+"""
+
+
+def schedules(chunks):
+    """
+    Return the schedule clauses arguments to benchmark with the given chunk sizes.
+    """
+    return ['static'] + [f'{kind}, {chunk}' for kind in ('static', 'dynamic', 'guided') for chunk in chunks]
+
+
+def function_name(name):
+    return {'for': 'for_', 'parallel for': 'parallel_for'}.get(name, name)
+
+
+def load(directory, chunks):
+    """
+    Generate, enable and import the module holding the benchmarks.
+    """
+    source = HEADER + ''.join(SYNCHRONIZATION.values())
+    for i, schedule in enumerate(schedules(chunks)):
+        source += SCHEDULING.format(function=f'schedule_{i}', schedule=schedule)
+
+    with open(os.path.join(directory, 'omp_bench_overheads.py'), 'w') as file:
+        file.write(source)
+
+    sys.modules.pop('omp_bench_overheads', None)
+    importlib.invalidate_caches()
+    return importlib.import_module('omp_bench_overheads')
+
+
+def calibrate(module, delay):
+    """
+    Return the length of the delay loop taking about the given time, in seconds.
+    """
+    length = 1
+    while True:
+        start = time.perf_counter()
+        module.delay(length)
+        elapsed = time.perf_counter() - start
+        if elapsed > 0.001:
+            return max(1, round(length * delay / elapsed))
+        length *= 2
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def measure(module, function, factor, length, threads, iterations, repeat, target):
+    """
+    Return the overheads per repetition of the given benchmark function, measured `repeat` times.
+
+    The number of repetitions grows until a measurement takes the target time. The reference runs `factor` times as
+    many delays.
+    """
+    reps = threads
+    while timed(function, reps, length, threads, iterations) < target:
+        reps *= 2
+
+    overheads = []
+    for _ in range(repeat):
+        test = timed(function, reps, length, threads, iterations)
+        reference = timed(module.reference, reps * factor, length, threads, iterations)
+        overheads.append((test - reference) / reps)
+    return overheads
+
+
+def run(thread_counts, delay, chunks, iterations, repeat, target, selected=None):
+    """
+    Return the overhead results of the benchmarks: see `results`.
+    """
+    omp.core.cache.enabled = False
+    sys.dont_write_bytecode = True
+
+    benchmarks = [(name, function_name(name), 1, {}) for name in SYNCHRONIZATION]
+    benchmarks += [('schedule', f'schedule_{i}', iterations, {'schedule': schedule})
+                   for i, schedule in enumerate(schedules(chunks))]
+    if selected:
+        benchmarks = [benchmark for benchmark in benchmarks if benchmark[0] in selected]
+
+    measured = []
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        try:
+            module = load(directory, chunks)
+        finally:
+            sys.path.remove(directory)
+
+        length = calibrate(module, delay)
+        for threads in thread_counts:
+            omp.set_num_threads(threads)
+            for name, function, factor, params in benchmarks:
+                overheads = measure(module, getattr(module, function), factor, length, threads, iterations, repeat,
+                                    target)
+                measured.append(results.result(name, {'threads': threads, **params}, statistics.median(overheads),
+                                               min=min(overheads), max=max(overheads)))
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--delay', type=float, default=10, help='work enclosed by each construct, in microseconds')
+    parser.add_argument('--chunks', type=int, nargs='+', default=[1, 8, 64])
+    parser.add_argument('--iterations', type=int, default=128, help='iterations per thread of the scheduling loops')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--target', type=float, default=0.05, help='minimum time of a measurement, in seconds')
+    parser.add_argument('--only', nargs='+', choices=[*SYNCHRONIZATION, 'schedule'], help='benchmarks to run')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    measured = run(args.threads, args.delay / 1e6, args.chunks, args.iterations, args.repeat, args.target, args.only)
+
+    print(f'{"benchmark":<14}{"schedule":<14}{"threads":>8}{"overhead (us)":>16}{"min (us)":>12}')
+    for entry in measured:
+        params = entry['params']
+        print(f'{entry["name"]:<14}{params.get("schedule", ""):<14}{params["threads"]:>8}'
+              f'{entry["seconds"] * 1e6:>16.2f}{entry["min"] * 1e6:>12.2f}')
+
+    if args.output:
+        results.write(args.output, 'overheads', measured)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Machine-readable benchmark results.
+
+Each benchmark writes a JSON file holding the environment of the run and a list of results, each with a `name`, the
+`params` of the measurement, and the measured `seconds`. Results of different runs are matched by name and params:
+see `compare.py`.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import omp  # noqa: E402
+
+
+def commit():
+    """
+    Return the git commit of the library, or None outside of a git checkout.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    return {
+        'version': omp.__version__,
+        'commit': commit(),
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'gil': getattr(sys, '_is_gil_enabled', lambda: True)(),
+        'platform': platform.platform(),
+        'cpus': omp.get_num_procs(),
+    }
+
+
+def result(name, params, seconds, **statistics):
+    return {'name': name, 'params': params, 'seconds': seconds, **statistics}
+
+
+def key(entry):
+    """
+    Return the identity of the given result, matching the same measurement across runs.
+    """
+    return entry['name'], tuple(sorted(entry['params'].items()))
+
+
+def write(path, suite, results):
+    with open(path, 'w') as file:
+        json.dump({'suite': suite, 'environment': environment(), 'results': results}, file, indent=2)
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
@@ -6,13 +6,17 @@ N = 400000000
 
 
 @omp.enable
-def main():
+def parallel_sum(n):
     acc = 0
     with OpenMP("parallel"):
         with OpenMP("for reduction(+:acc) schedule(dynamic, 10000)"):
-            for i in range(1, N):
+            for i in range(1, n):
                 acc += i
-    print("Actual result:  ", acc)
+    return acc
+
+
+def main():
+    print("Actual result:  ", parallel_sum(N))
     print("Expected result:", N*(N-1)//2)
 
 
@@ -1,9 +1,12 @@
+__version__ = '0.1.0'
+
 import omp.core as core
 import omp.directives as directives
 import omp.clauses as clauses
 
 from omp.core.openmp import OpenMP
 from omp.core.entry import enable
+from omp.core.profiler import Profiler
 
 from threading import current_thread
 
@@ -14,6 +17,7 @@ clauses
 
 OpenMP
 enable
+Profiler
 
 get_num_procs = core.primitives.get_num_procs
 set_num_threads = core.primitives.set_num_threads
@@ -23,7 +27,27 @@ get_max_teams = core.primitives.get_max_teams
 get_thread_num = core.primitives.get_thread_num
 get_num_threads = core.primitives.get_num_threads
 get_dynamic = core.primitives.get_dynamic
+get_cancellation = core.primitives.get_cancellation
+set_max_active_levels = core.primitives.set_max_active_levels
+get_max_active_levels = core.primitives.get_max_active_levels
+get_thread_limit = core.primitives.get_thread_limit
+get_proc_bind = core.primitives.get_proc_bind
+get_num_places = core.primitives.get_num_places
+get_place_num_procs = core.primitives.get_place_num_procs
+get_place_proc_ids = core.primitives.get_place_proc_ids
+get_place_num = core.primitives.get_place_num
+get_partition_num_places = core.primitives.get_partition_num_places
+get_partition_place_nums = core.primitives.get_partition_place_nums
+get_level = core.primitives.get_level
+get_active_level = core.primitives.get_active_level
+get_ancestor_thread_num = core.primitives.get_ancestor_thread_num
+get_team_size = core.primitives.get_team_size
 set_schedule = core.primitives.set_schedule
 get_schedule = core.primitives.get_schedule
+declare_reduction = clauses.reduction.declare
+set_backend = core.primitives.set_backend
+get_backend = core.primitives.get_backend
+register_callback = core.tools.register
+unregister_callback = core.tools.unregister
 
 current_thread().icv = core.primitives.InternalControlVariables(current_thread())
@@ -2,9 +2,27 @@ import omp.clauses.private as private
 import omp.clauses.nowait as nowait
 import omp.clauses.reduction as reduction
 import omp.clauses.schedule as schedule
+import omp.clauses.hint as hint
+import omp.clauses.atomic as atomic
+import omp.clauses.task as task
+import omp.clauses.collapse as collapse
+import omp.clauses.chunked as chunked
+import omp.clauses.proc_bind as proc_bind
+import omp.clauses.ordered as ordered
+import omp.clauses.cancel as cancel
+import omp.clauses.prefetch as prefetch
 
 
 private
 nowait
 reduction
 schedule
+hint
+atomic
+task
+collapse
+chunked
+proc_bind
+ordered
+cancel
+prefetch
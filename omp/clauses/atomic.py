@@ -0,0 +1,45 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('read', ('atomic',))
+class ReadClause(Clause):
+
+    name = 'read'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.form = 'read'
+
+
+@OpenMP.clause('write', ('atomic',))
+class WriteClause(Clause):
+
+    name = 'write'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.form = 'write'
+
+
+@OpenMP.clause('update', ('atomic',))
+class UpdateClause(Clause):
+
+    name = 'update'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.form = 'update'
+
+
+@OpenMP.clause('capture', ('atomic',))
+class CaptureClause(Clause):
+
+    name = 'capture'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.form = 'capture'
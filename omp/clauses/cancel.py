@@ -0,0 +1,33 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+class ConstructTypeClause(Clause):
+
+    """
+    Selects the construct cancelled by a cancel directive, or checked by a cancellation point directive.
+    """
+
+    name = None
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.construct = self.name
+
+
+@OpenMP.clause('parallel', ('cancel', 'cancellation point'))
+class ParallelClause(ConstructTypeClause):
+
+    name = 'parallel'
+
+
+@OpenMP.clause('for', ('cancel', 'cancellation point'))
+class ForClause(ConstructTypeClause):
+
+    name = 'for'
+
+
+@OpenMP.clause('sections', ('cancel', 'cancellation point'))
+class SectionsClause(ConstructTypeClause):
+
+    name = 'sections'
@@ -0,0 +1,12 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('chunked', ('for',))
+class ChunkedClause(Clause):
+
+    name = 'chunked'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.chunked = True
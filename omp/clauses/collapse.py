@@ -0,0 +1,12 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('collapse', ('for',))
+class CollapseClause(Clause):
+
+    name = 'collapse'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.collapse = int(args)
@@ -0,0 +1,12 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('hint', ('critical',))
+class HintClause(Clause):
+
+    name = 'hint'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.hint = args.strip().removeprefix('omp_sync_hint_')
@@ -0,0 +1,12 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('ordered', ('for',))
+class OrderedClause(Clause):
+
+    name = 'ordered'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.ordered = True
@@ -0,0 +1,16 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('prefetch', ('for',))
+class PrefetchClause(Clause):
+
+    name = 'prefetch'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        # Without a depth, the queue holds as many chunks as there are threads in the team.
+        depth = int(args) if args.strip() else 0
+        if depth < 0:
+            raise ValueError(f'Invalid prefetch depth {depth}, expected a positive number of chunks.')
+        directive.prefetch = depth
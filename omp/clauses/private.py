@@ -1,7 +1,7 @@
 from omp.core.openmp import OpenMP, Clause
 
 
-@OpenMP.clause('private', ('critical', 'for', 'parallel', 'single'))
+@OpenMP.clause('private', ('critical', 'for', 'parallel', 'single', 'task'))
 class PrivateClause(Clause):
 
     name = 'private'
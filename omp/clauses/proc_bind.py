@@ -0,0 +1,15 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('proc_bind', ('parallel',))
+class ProcBindClause(Clause):
+
+    name = 'proc_bind'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        policy = args.strip().lower().replace('master', 'primary')
+        if policy not in ('primary', 'close', 'spread'):
+            raise ValueError(f'Invalid proc_bind policy {policy!r}, expected primary, close or spread.')
+        directive.proc_bind = policy
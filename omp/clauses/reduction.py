@@ -1,7 +1,11 @@
 from omp.core.openmp import OpenMP, Clause
+from omp.core.threading import CancelledRegion, Workshare
 
+import math
+import threading
 
-@OpenMP.clause('reduction', ('for'))
+
+@OpenMP.clause('reduction', ('for',))
 class ReductionClause(Clause):
 
     name = 'reduction'
@@ -9,19 +13,137 @@ class ReductionClause(Clause):
     def __init__(self, directive, args):
         super().__init__(directive, args)
 
-        operator, varname = args.split(':')
+        operator, varnames = args.split(':')
 
-        self.directive.privates.add(varname.strip())
-        self.directive.reduction.update({varname: operator})
+        for varname in varnames.split(','):
+            self.directive.privates.add(varname.strip())
+            self.directive.reduction.update({varname.strip(): operator.strip()})
 
 
 operators = {
     '+': lambda a, b: a + b,
+    '-': lambda a, b: a + b,
     '*': lambda a, b: a * b,
     '&': lambda a, b: a & b,
     '|': lambda a, b: a | b,
     '^': lambda a, b: a ^ b,
     '&&': lambda a, b: a and b,
     '||': lambda a, b: a or b,
+    'min': min,
+    'max': max,
     None: lambda a, b: a
 }
+
+# Return the initial value of the private copy of a reduction variable, for each operator.
+initializers = {
+    '+': lambda: 0,
+    '-': lambda: 0,
+    '*': lambda: 1,
+    '&': lambda: ~0,
+    '|': lambda: 0,
+    '^': lambda: 0,
+    '&&': lambda: True,
+    '||': lambda: False,
+    'min': lambda: math.inf,
+    'max': lambda: -math.inf,
+}
+
+
+def declare(name: str, combiner, initializer):
+    """
+    Declare a reduction operator that can be used in reduction clauses, like the `declare reduction` directive.
+
+    `combiner(a, b)` must be associative and return the combination of two partial results.
+    `initializer()` must return a new identity value of the operator, for the private copy of each thread.
+
+    For instance, `omp.declare_reduction('merge', operator.or_, dict)` allows to merge dicts with `reduction(merge:d)`.
+    """
+    operators[name] = combiner
+    initializers[name] = initializer
+
+
+def initial_values(ops):
+    return [initializers[op]() for op in ops]
+
+
+class TreeReduction(Workshare):
+
+    """
+    Combines the partial results of the threads of a team along a binary tree.
+
+    Each thread combines the results of its children in the tree into its own, then deposits them in its slot for its
+    parent. The results are combined in log2(size) steps, and always in the same order for a given team size.
+
+    The threads wait for their children on the task condition of the team, which is notified when the team is aborted
+    or cancelled: a child whose loop raised, or which cancelled the parallel region, never deposits its results.
+    """
+
+    def __init__(self, team, index):
+        super().__init__(team, index)
+        self.slots = [None] * team.size
+        # Whether the results of each slot were deposited.
+        self.deposited = [False] * team.size
+
+    def wait(self, child):
+        """
+        Wait for the results of the given child to be deposited.
+        """
+        if self.deposited[child]:
+            return
+
+        team = self.team
+        with team.tasks_condition:
+            while not self.deposited[child]:
+                if team.barrier.broken:
+                    raise threading.BrokenBarrierError
+                if team.cancelled:
+                    raise CancelledRegion
+                team.tasks_condition.wait()
+
+    def combine(self, rank, ops, partials):
+        """
+        Return the results of the whole team in the thread 0, and None in the others.
+        """
+        step = 1
+        while step < self.team.size and rank % (2 * step) == 0:
+            child = rank + step
+            if child < self.team.size:
+                self.wait(child)
+                partials = [operators[op](mine, theirs) for op, mine, theirs in zip(ops, partials, self.slots[child])]
+            step *= 2
+
+        if rank == 0:
+            return partials
+
+        with self.team.tasks_condition:
+            self.slots[rank] = partials
+            self.deposited[rank] = True
+            self.team.tasks_condition.notify_all()
+        return None
+
+
+def combine(ops, names, values, partials):
+    """
+    Combine the partial results of every thread of the team into the values of the reduction variables.
+
+    Return the new values of the reduction variables in the thread that must assign them, and None in the others.
+    """
+    thread = threading.current_thread()
+    team = thread.team
+
+    if not team.shares_memory:
+        # The partial results are combined by the process that started the team.
+        team.partials.extend(zip(names, ops, partials))
+        return None
+
+    if team.size > 1:
+        state = team.workshare(TreeReduction)
+        try:
+            partials = state.combine(thread.rank, ops, partials)
+        finally:
+            state.leave()
+
+        if partials is None:
+            return None
+
+    return [operators[op](value, partial) for op, value, partial in zip(ops, values, partials)]
@@ -1,7 +1,6 @@
 from omp.core.openmp import OpenMP, Clause
 from omp.core.primitives import Sched
 
-import omp
 
 @OpenMP.clause('schedule', ('for',))
 class ScheduleClause(Clause):
@@ -13,4 +12,5 @@ class ScheduleClause(Clause):
 
         split_args = args.split(',')
 
-        directive.schedule = (Sched[split_args[0]], int(split_args[-1]) if len(split_args) > 1 else omp.get_schedule()[1])
+        # Without a chunk size, each schedule kind uses its own default.
+        directive.schedule = (Sched[split_args[0].strip()], int(split_args[-1]) if len(split_args) > 1 else None)
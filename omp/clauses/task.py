@@ -0,0 +1,23 @@
+from omp.core.openmp import OpenMP, Clause
+
+
+@OpenMP.clause('if', ('task',))
+class IfClause(Clause):
+
+    name = 'if'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.if_ = args.strip()
+
+
+@OpenMP.clause('final', ('task',))
+class FinalClause(Clause):
+
+    name = 'final'
+
+    def __init__(self, directive, args):
+        super().__init__(directive, args)
+
+        directive.final = args.strip()
@@ -1,10 +1,22 @@
 import omp.core.entry as entry
 import omp.core.openmp as openmp
 import omp.core.threading as threading
+import omp.core.processes as processes
+import omp.core.interpreters as interpreters
 import omp.core.ast_tools as ast_tools
+import omp.core.cache as cache
+import omp.core.affinity as affinity
+import omp.core.tools as tools
+import omp.core.profiler as profiler
 
 # Avoid linter warnings for package shortcuts definitions.
 entry
 openmp
 threading
+processes
+interpreters
 ast_tools
+cache
+affinity
+tools
+profiler
@@ -0,0 +1,170 @@
+import os
+import threading
+
+
+def available_cpus() -> list[int]:
+    """
+    Return the processors the process is allowed to run on.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def topology(cpu: int, name: str):
+    """
+    Return the identifier of the core (`core_id`) or socket (`physical_package_id`) of the given processor, or the
+    processor itself when the topology is unknown.
+    """
+    try:
+        with open(f'/sys/devices/system/cpu/cpu{cpu}/topology/{name}') as file:
+            return int(file.read())
+    except (OSError, ValueError):
+        return cpu
+
+
+def abstract_places(name: str, count: int = None) -> list[tuple[int]]:
+    """
+    Return the places given by an abstract name of OMP_PLACES: `threads`, `cores` or `sockets`.
+    """
+    cpus = available_cpus()
+    if name == 'threads':
+        places = [(cpu,) for cpu in cpus]
+    elif name in ('cores', 'sockets'):
+        groups = {}
+        for cpu in cpus:
+            socket = topology(cpu, 'physical_package_id')
+            key = (socket, topology(cpu, 'core_id')) if name == 'cores' else socket
+            groups.setdefault(key, []).append(cpu)
+        places = [tuple(group) for group in groups.values()]
+    else:
+        raise ValueError(f'Unknown abstract place name {name!r} in OMP_PLACES, expected threads, cores or sockets.')
+
+    return places[:count] if count is not None else places
+
+
+def split_top_level(value: str) -> list[str]:
+    """
+    Split the given list on the commas which are not between braces.
+    """
+    items, depth, start = [], 0, 0
+    for i, char in enumerate(value):
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            items.append(value[start:i])
+            start = i + 1
+    items.append(value[start:])
+    return [item.strip() for item in items]
+
+
+def interval(value: str) -> tuple[int, int, int]:
+    """
+    Parse a `start[:length[:stride]]` interval.
+    """
+    parts = [int(part) for part in value.split(':')]
+    if len(parts) > 3:
+        raise ValueError(f'Invalid interval {value!r} in OMP_PLACES.')
+    return (parts + [1, 1])[:3] if len(parts) > 1 else (parts[0], 1, 1)
+
+
+def parse_places(value: str) -> list[tuple[int]]:
+    """
+    Parse the value of OMP_PLACES: an abstract name with an optional number of places, as in `cores(4)`, or a list of
+    explicit places, as in `{0,1},{2,3}`, `{0:2}:2:2`.
+    """
+    value = value.strip()
+    if not value.startswith('{'):
+        name, _, count = value.partition('(')
+        return abstract_places(name.strip().lower(), int(count.rstrip(')')) if count else None)
+
+    places = []
+    for item in split_top_level(value):
+        resources, _, repetition = item.partition('}')
+        if not resources.startswith('{'):
+            raise ValueError(f'Invalid place {item!r} in OMP_PLACES.')
+
+        place = []
+        for resource in split_top_level(resources[1:]):
+            start, length, stride = interval(resource)
+            place.extend(range(start, start + length * stride, stride))
+
+        # A place can be followed by `:count[:stride]`, repeating it with its processors shifted by the stride.
+        _, count, stride = interval('0' + repetition) if repetition else (0, 1, 1)
+        places.extend(tuple(cpu + i * stride for cpu in place) for i in range(count))
+
+    return places
+
+
+def parse_proc_bind(value: str) -> tuple[str]:
+    """
+    Parse the value of OMP_PROC_BIND: `true`, `false`, or a list of `primary`, `close` and `spread` policies, one for
+    each nesting level.
+    """
+    policies = tuple(policy.strip().lower().replace('master', 'primary') for policy in value.split(','))
+    for policy in policies:
+        if policy not in ('true', 'false', 'primary', 'close', 'spread'):
+            raise ValueError(f'Invalid policy {policy!r} in OMP_PROC_BIND.')
+    return policies
+
+
+# The processors of the process when the library was loaded, which unbound threads can run on.
+cpus = available_cpus()
+
+_OMP_PLACES = 'OMP_PLACES'
+# The places threads can be bound to, as tuples of processors. They are numbered from 0.
+places = parse_places(os.environ[_OMP_PLACES]) if _OMP_PLACES in os.environ else abstract_places('threads')
+
+_OMP_PROC_BIND = 'OMP_PROC_BIND'
+# Threads are not bound by default, unless places are given.
+default_bind = parse_proc_bind(os.environ.get(_OMP_PROC_BIND, 'true' if _OMP_PLACES in os.environ else 'false'))
+
+
+def assign(policy: str, place_num: int, partition: tuple[int], size: int):
+    """
+    Return the place number and place partition of each thread of a team of the given size, bound with the given
+    policy by a thread bound to the given place and partition. Return None if the threads are not bound.
+    """
+    if policy == 'false' or not partition:
+        return None
+
+    count = len(partition)
+    start = partition.index(place_num) if place_num in partition else 0
+
+    if policy == 'primary':
+        return [(partition[start], partition)] * size
+
+    if policy == 'close' or size > count:
+        # Consecutive threads are assigned to consecutive places, starting from the place of the parent thread.
+        # When there are more threads than places, consecutive threads share places.
+        assignment = [partition[(start + (rank if size <= count else rank * count // size)) % count]
+                      for rank in range(size)]
+        if policy == 'close':
+            return [(place, partition) for place in assignment]
+        return [(place, (place,)) for place in assignment]
+
+    # Spread, including true: the partition is split in one subpartition per thread, bound to its first place.
+    assignment = []
+    for rank in range(size):
+        subpartition = tuple(partition[(start + i) % count]
+                             for i in range(rank * count // size, (rank + 1) * count // size))
+        assignment.append((subpartition[0], subpartition))
+    return assignment
+
+
+def bind(place_num):
+    """
+    Bind the current thread to the given place, or unbind it if the place is None.
+    """
+    thread = threading.current_thread()
+    if getattr(thread, 'bound_place', None) == place_num or not hasattr(os, 'sched_setaffinity'):
+        return
+
+    try:
+        os.sched_setaffinity(0, places[place_num] if place_num is not None else cpus)
+    except OSError:
+        # The place holds processors the process may not use.
+        return
+    thread.bound_place = place_num
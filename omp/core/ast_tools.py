@@ -17,3 +17,99 @@ class LinenoStripper(ast.NodeTransformer):
                 delattr(new, attr)
 
         return self.generic_visit(new)
+
+
+class LocalsCollector(ast.NodeVisitor):
+    """
+    Collects the names bound by a list of statements, as if they were the body of a function.
+
+    This mirrors how the compiler builds its symbol tables: nested functions, classes, lambdas and comprehensions are
+    separate scopes, and the names declared global or nonlocal are not local to the function.
+    """
+
+    def __init__(self):
+        self.bound = {}
+        self.declared = set()
+
+    @classmethod
+    def collect(cls, body: list[ast.AST]) -> list[str]:
+        collector = cls()
+        for statement in body:
+            collector.visit(statement)
+        return [name for name in collector.bound if name not in collector.declared]
+
+    @classmethod
+    def collect_function(cls, node: ast.FunctionDef) -> list[str]:
+        """
+        Return the local variables of the given function, including its parameters.
+        """
+        args = node.args
+        parameters = [arg.arg for arg in args.posonlyargs + args.args + args.kwonlyargs]
+        parameters += [arg.arg for arg in (args.vararg, args.kwarg) if arg is not None]
+        return parameters + [name for name in cls.collect(node.body) if name not in parameters]
+
+    def bind(self, name: str):
+        self.bound[name] = None
+
+    def visit_Name(self, node: ast.Name):
+        if isinstance(node.ctx, (ast.Store, ast.Del)):
+            self.bind(node.id)
+
+    def visit_Global(self, node: ast.Global):
+        self.declared.update(node.names)
+
+    visit_Nonlocal = visit_Global
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.name != '*':
+                self.bind(alias.asname or alias.name.split('.')[0])
+
+    visit_ImportFrom = visit_Import
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler):
+        if node.name:
+            self.bind(node.name)
+        self.generic_visit(node)
+
+    def visit_MatchAs(self, node):
+        if node.name:
+            self.bind(node.name)
+        self.generic_visit(node)
+
+    visit_MatchStar = visit_MatchAs
+
+    def visit_MatchMapping(self, node):
+        if node.rest:
+            self.bind(node.rest)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        # Only the decorators and the default values are evaluated in the enclosing scope.
+        self.bind(node.name)
+        for child in node.decorator_list + node.args.defaults + node.args.kw_defaults:
+            if child is not None:
+                self.visit(child)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.bind(node.name)
+        for child in node.decorator_list + node.bases + node.keywords:
+            self.visit(child)
+
+    def visit_Lambda(self, node: ast.Lambda):
+        for child in node.args.defaults + node.args.kw_defaults:
+            if child is not None:
+                self.visit(child)
+
+    def visit_comprehension_scope(self, node):
+        # Comprehension variables are local to the comprehension, but assignment expressions bind in the enclosing scope.
+        for child in ast.walk(node):
+            if isinstance(child, ast.NamedExpr):
+                self.bind(child.target.id)
+
+    visit_ListComp = visit_comprehension_scope
+    visit_SetComp = visit_comprehension_scope
+    visit_DictComp = visit_comprehension_scope
+    visit_GeneratorExp = visit_comprehension_scope
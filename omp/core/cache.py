@@ -0,0 +1,115 @@
+import importlib.util
+import linecache
+import marshal
+import os
+import sys
+
+from types import CodeType, FunctionType
+
+import omp
+
+# The transformed code of enabled functions is cached next to the bytecode of their module, unless OMP_CACHE=0.
+_OMP_CACHE = 'OMP_CACHE'
+enabled = os.environ.get(_OMP_CACHE, '1') != '0'
+
+_library_digest = None
+
+
+def sha256(data: bytes):
+    # hashlib is only imported once needed: subinterpreters, which run the regions of the interpreter backend without
+    # transforming code, cannot be destroyed cleanly once they imported it on some Python versions.
+    import hashlib
+    return hashlib.sha256(data)
+
+
+def library_digest() -> bytes:
+    """
+    Return a digest identifying the version of the library, which determines the transformation of the code.
+    """
+    global _library_digest
+
+    if _library_digest is None:
+        digest = sha256(omp.__version__.encode())
+        root = os.path.dirname(omp.__file__)
+        for directory, subdirectories, files in sorted(os.walk(root)):
+            subdirectories.sort()
+            for file in sorted(files):
+                if file.endswith('.py'):
+                    stat = os.stat(os.path.join(directory, file))
+                    digest.update(f'{os.path.relpath(os.path.join(directory, file), root)}:{stat.st_size}:{stat.st_mtime_ns};'.encode())
+        _library_digest = digest.digest()
+
+    return _library_digest
+
+
+def key(function: FunctionType, *parts) -> bytes:
+    """
+    Return the cache key of the transformed code of the given function.
+
+    The key covers the source of the function's module, the library and interpreter versions, and the given parts,
+    which should include everything else the transformation depends on.
+    """
+    digest = sha256(library_digest())
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(''.join(linecache.getlines(function.__code__.co_filename)).encode())
+    digest.update(repr((function.__qualname__, function.__code__.co_firstlineno) + parts).encode())
+    return digest.digest()
+
+
+def path(function: FunctionType):
+    """
+    Return the path of the cache file of the given function, or None if its module has no source file.
+    """
+    try:
+        pyc = importlib.util.cache_from_source(function.__code__.co_filename)
+    except (NotImplementedError, ValueError):
+        return None
+
+    return f'{pyc[:-len(".pyc")]}.{function.__qualname__}.omp.pyc'
+
+
+def load(function: FunctionType, cache_key: bytes):
+    """
+    Return the cached code of the given function, or None if it is missing or stale.
+    """
+    cache_path = path(function)
+    if not enabled or cache_path is None:
+        return None
+
+    try:
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if data[:len(cache_key)] != cache_key:
+        return None
+
+    try:
+        code = marshal.loads(data[len(cache_key):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    return code if isinstance(code, CodeType) else None
+
+
+def store(function: FunctionType, cache_key: bytes, code: CodeType):
+    """
+    Write the transformed code of the given function to its cache file. Failures are silently ignored.
+    """
+    cache_path = path(function)
+    if not enabled or sys.dont_write_bytecode or cache_path is None:
+        return
+
+    # Write to a temporary file first, so that concurrent processes never read a partial cache file.
+    temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temporary_path, 'wb') as file:
+            file.write(cache_key + marshal.dumps(code))
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
@@ -1,5 +1,6 @@
 import omp.core.openmp
-from omp.core.ast_tools import LinenoStripper
+import omp.core.cache
+from omp.core.ast_tools import LinenoStripper, LocalsCollector
 
 import ast
 import copy
@@ -12,25 +13,79 @@ from types import CodeType, FunctionType
 
 class OpenMPTransformer(ast.NodeTransformer):
     """
-    Recursively find the OpenMP constructs and replace them with their implementations.
+    Find the OpenMP constructs and replace them with their implementations, in a single bottom-up pass.
+
+    The implementation of a construct can itself contain constructs, which are transformed in turn.
+    The body of the construct, which was already transformed, is not visited again.
     """
 
+    # How the templates of the constructs refer to the OpenMP class.
+    INTERNAL_NAME = '_omp_internal.core.openmp.OpenMP'
+
     def __init__(self, locs=None, globs=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.locs = locs
         self.globs = globs
 
-    def visit_With(self, node: ast.With) -> ast.With:
-        # We need to make sure that this is an OpenMP construct.
+        # Objects referred to by the names called in with statements.
+        self.resolved = {}
+        # Whether the transformation only depends on the source: directives with arguments other than constants are
+        # evaluated, and their values can change from one run to the next.
+        self.cacheable = True
+        # The local variables of the functions enclosing the visited node, innermost last.
+        self.scopes = [set()]
+
+    # The attribute marking the statements that were already transformed. The statements themselves are marked, as
+    # the identifiers of the nodes discarded by the directives are reused by new nodes.
+    TRANSFORMED = '_omp_transformed'
+
+    def visit(self, node: ast.AST) -> ast.AST:
+        if getattr(node, self.TRANSFORMED, False):
+            return node
+        return super().visit(node)
 
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        self.scopes.append(set(LocalsCollector.collect_function(node)))
+        try:
+            return self.generic_visit(node)
+        finally:
+            self.scopes.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def resolve(self, ref: ast.AST):
+        """
+        Return the object referred to by the given name or attribute chain in the function's definition namespace.
+        """
+        dotted = ast.unparse(ref)
+        if dotted == self.INTERNAL_NAME:
+            return omp.core.openmp.OpenMP
+        if dotted.startswith('_omp_internal'):
+            # Other internal names are generated by the directives, and are never OpenMP constructs.
+            return None
+
+        if dotted not in self.resolved:
+            expr: ast.Expression = ast.Expression(ref)
+            try:
+                self.resolved[dotted] = eval(compile(expr, filename='<OMP Parser>', mode='eval'), self.globs, self.locs)
+            except NameError:
+                # The name we are trying to evaluate could be undefined in the context.
+                self.resolved[dotted] = None
+
+        return self.resolved[dotted]
+
+    def construct(self, node: ast.With):
+        """
+        Return the OpenMP instance of the given with statement if it is an OpenMP construct, or None.
+        """
         # The with statement should use only one context manager.
         if len(node.items) != 1:
-            return self.generic_visit(node)
+            return None
 
         # Bulletproofing.
         if not isinstance(node.items[0], ast.withitem):
-            return self.generic_visit(node)
+            return None
 
         # We are now sure we have a withitem.
         item: ast.withitem = node.items[0]
@@ -39,7 +94,7 @@ class OpenMPTransformer(ast.NodeTransformer):
         # This means calling the constructor.
 
         if not isinstance(item.context_expr, ast.Call):
-            return self.generic_visit(node)
+            return None
 
         call: ast.Call = item.context_expr
 
@@ -49,39 +104,69 @@ class OpenMPTransformer(ast.NodeTransformer):
             ref: ast.Attribute
             # Bulletproofing
             if not isinstance(ref.ctx, ast.Load):
-                return self.generic_visit(node)
+                return None
             ref = ref.value
 
         if not isinstance(ref, ast.Name):
-            return self.generic_visit(node)
+            return None
 
         name: ast.Name = ref
 
         # Bulletproofing.
 
         if not isinstance(name.ctx, ast.Load):
-            return self.generic_visit(node)
+            return None
 
         # In order to check that this call indeed an OpenMP instanciation,
         # we will evaluate the name being called in the function's definition namespace.
+        if self.resolve(call.func) is not omp.core.openmp.OpenMP:
+            return None
 
-        expr: ast.Expression = ast.Expression(call.func)
-        try:
-            called = eval(compile(expr, filename='<OMP Parser>', mode='eval'), self.globs, self.locs)
-        except NameError:
-            # The name we are trying to evaluate could be undefined in the context.
-            return self.generic_visit(node)
+        # We are now sure this is an OpenMP construct. (Not necessarily a valid one.)
+        # We run the found instanciation.
+        if not call.keywords and all(isinstance(arg, ast.Constant) for arg in call.args):
+            return omp.core.openmp.OpenMP(*(arg.value for arg in call.args))
+        self.cacheable = False
+        return eval(compile(ast.Expression(call), filename='<OMP Parser>', mode='eval'), self.globs, self.locs)
 
-        if called is not omp.core.openmp.OpenMP:
-            return self.generic_visit(node)
+    def visit_With(self, node: ast.With) -> ast.With:
+        # Transforming the children **before** this node allows us to know the exhaustive list of local variables
+        # that will be involved in the inner function definitions.
+        node = self.generic_visit(node)
 
-        # We are now sure this is an OpenMP construct. (Not necessarily a valid one.)
-        # We run the found instanciation and run its logic on the found construct.
-        instruction = eval(compile(ast.Expression(call), filename='<OMP Parser>', mode='eval'), self.globs, self.locs)
+        instruction = self.construct(node)
+        if instruction is None:
+            return node
+        return self.expand(node, instruction)
+
+    def visit_AsyncWith(self, node: ast.AsyncWith) -> ast.AST:
+        node = self.generic_visit(node)
 
-        # Parsing this node **after** its children allows us to know the exhaustive list of local variables that will be
-        # involved in the inner function definitions.
-        return instruction._parse_With(ast.fix_missing_locations(self.generic_visit(node)))
+        instruction = self.construct(node)
+        if instruction is None:
+            return node
+
+        # Parallel constructs can be awaited in coroutines: the team runs while the event loop runs other tasks.
+        if getattr(instruction.dir_impl, 'asynchronous', None) is None:
+            raise SyntaxError('Only parallel constructs can be used in an async with statement.')
+        instruction.dir_impl.asynchronous = True
+
+        return self.expand(ast.copy_location(ast.With(items=node.items, body=node.body, type_comment=None), node),
+                           instruction)
+
+    def expand(self, node: ast.With, instruction: 'omp.core.openmp.OpenMP') -> ast.AST:
+        """
+        Run the logic of the given OpenMP instance on the construct it was found in.
+        """
+        for statement in node.body:
+            setattr(statement, self.TRANSFORMED, True)
+        if instruction.dir_impl is not None:
+            instruction.dir_impl.enclosing_locals = self.scopes[-1]
+        implementation = instruction._parse_With(node)
+        if implementation is node:
+            return node
+
+        return self.visit(implementation)
 
 
 class EnableFunction(ast.NodeTransformer):
@@ -98,6 +183,7 @@ class EnableFunction(ast.NodeTransformer):
         self.varnames = varnames
         if self.varnames is None:
             self.varnames = []
+        self.cacheable = True
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
         new = copy.deepcopy(node)
@@ -106,14 +192,41 @@ class EnableFunction(ast.NodeTransformer):
         # Inject a known name in the namespace for our library.
         new.body = [LinenoStripper().visit(ast.parse('import omp as _omp_internal', mode='exec').body[0])] + new.body
 
-        # Run OpenMPTransformer until the result stabilizes.
-        old_ver: str = ''
-        while old_ver != ast.dump(new):
-            old_ver = ast.dump(new)
-            new = OpenMPTransformer(self.globs, self.locs).visit(ast.fix_missing_locations(new))
-
+        # `transform` passes the globals and locals of the caller in this order, into the `locs` and `globs` parameters.
+        transformer = OpenMPTransformer(self.globs, self.locs)
+        new = transformer.visit(new)
+        self.cacheable = self.cacheable and transformer.cacheable
         return new
 
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+def transform(function, caller_frame, globs, locs) -> tuple[CodeType, bool]:
+    """
+    Return the code of the module-level definition of the given enabled function, with the OpenMP constructs
+    replaced by their implementations, and whether the code can be cached.
+    """
+
+    # Retrieve the source code of the decorated function.
+    src: str = textwrap.dedent(inspect.getsource(function))
+
+    # Convert the source code to ast.
+    src_ast: ast.Module = ast.parse(src, mode='exec')
+    src_ast = ast.increment_lineno(src_ast, caller_frame.f_lineno - src_ast.body[0].lineno + 1)
+
+    # Patch the source ast.
+    # We need to make sure that each node has a line number.
+    # Since the initial function was already compiled a first time, we can recover the
+    # local variables the function uses from its code object.
+    enabler = EnableFunction(globs, locs, function.__code__.co_varnames)
+    patched_ast = ast.fix_missing_locations(enabler.visit(src_ast))
+
+    # ALERT: Remove this debug print. (Shows the final transformed source code.)
+    # print(ast.unparse(patched_ast))
+
+    # Compile the patched ast.
+    return compile(patched_ast, filename=inspect.getsourcefile(function), mode='exec'), enabler.cacheable
+
 
 def enable(*args, **kwargs):
     """
@@ -142,26 +255,15 @@ def enable(*args, **kwargs):
         # We need _omp_internal for our own compilations.
         locs.update({'_omp_internal': omp})
 
-        # Retrieve the source code of the decorated function.
-        src: str = textwrap.dedent(inspect.getsource(function))
-
-        # Convert the source code to ast.
-        src_ast: ast.Module = ast.parse(src, mode='exec')
-        src_ast = ast.increment_lineno(src_ast, caller_frame.f_lineno - src_ast.body[0].lineno + 1)
-
-        # Patch the source ast.
-        # We need to make sure that each node has a line number.
-        # Since the initial function was already compiled a first time, we can recover the
-        # local variables the function uses from its code object.
-        patched_ast = ast.fix_missing_locations(
-            EnableFunction(globs, locs, function.__code__.co_varnames).visit(src_ast)
-            )
-
-        # ALERT: Remove this debug print. (Shows the final transformed source code.)
-        # print(ast.unparse(patched_ast))
-
-        # Compile the patched ast.
-        patched: CodeType = compile(patched_ast, filename=inspect.getsourcefile(function), mode='exec')
+        # The transformed code is cached on disk. The runtime schedule is resolved when the loops are transformed.
+        # Functions whose directives are evaluated are not cached, as the values of their directives are not known
+        # before transforming them.
+        cache_key = omp.core.cache.key(function, caller_frame.f_lineno, omp.get_schedule())
+        patched = omp.core.cache.load(function, cache_key)
+        if patched is None:
+            patched, cacheable = transform(function, caller_frame, globs, locs)
+            if cacheable:
+                omp.core.cache.store(function, cache_key, patched)
 
         # redefine the function in the initial context.
         # TODO: Allow enabling a function with closure (nested enabled function)
@@ -0,0 +1,376 @@
+import atexit
+import builtins
+import importlib
+import io
+import marshal
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+import traceback
+import types
+
+import omp.core.primitives
+from omp.core.threading import Team, Task
+from omp.core.processes import combine, _cell_value, _shared_cells, _written, _EMPTY
+import omp
+
+try:
+    import _interpreters as interpreters
+except ImportError:
+    try:
+        import _xxsubinterpreters as interpreters
+    except ImportError:
+        interpreters = None
+
+# Subinterpreters have a GIL of their own from Python 3.12 onwards.
+available = interpreters is not None and sys.version_info >= (3, 12)
+
+
+class PipeBarrier:
+
+    """
+    A barrier shared by the members of a team of interpreters, which cannot share Python objects.
+
+    Each member reports its arrival through a pipe read by the interpreter that started the team, and waits on a pipe
+    of its own until all the members arrived.
+    """
+
+    def __init__(self, rank, arrivals, release):
+        self.rank = rank
+        self.arrivals = arrivals
+        self.release = release
+
+    def wait(self):
+        os.write(self.arrivals, MESSAGE.pack(b'a', self.rank))
+        if os.read(self.release, 1) != b'r':
+            raise threading.BrokenBarrierError
+
+    def abort(self):
+        os.write(self.arrivals, MESSAGE.pack(b'x', self.rank))
+
+
+class PipeLock:
+
+    """
+    A lock shared by the members of a team of interpreters: the member holding the single byte of a pipe holds the lock.
+    """
+
+    def __init__(self, read, write):
+        self.read = read
+        self.write = write
+
+    def acquire(self):
+        os.read(self.read, 1)
+
+    def release(self):
+        os.write(self.write, b'l')
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class InterpreterTeam(Team):
+
+    """
+    Represents a team of subinterpreters, as seen by one of its members.
+
+    Each team member runs a copy of the region function in its own interpreter, with its own GIL. Like the process
+    backend, only the partial results of the reductions are sent back.
+    """
+
+    shares_memory = False
+
+    def __init__(self, size, barrier, lock):
+        super().__init__(size=0)
+
+        self.size = size
+        self.barrier = barrier
+        self.lock = lock
+
+        # Partial results of the reductions run by the current team member, as (name, operator, value) tuples.
+        self.partials = []
+
+
+# The messages of the members to the interpreter that started the team: a kind, `a` for an arrival at the barrier,
+# `x` for an aborted barrier, `d` once done, and the rank of the member.
+MESSAGE = struct.Struct('=ci')
+
+
+class Pickler(pickle.Pickler):
+
+    """
+    Pickles objects for another interpreter, which cannot import the classes and functions of the main module.
+    """
+
+    def persistent_id(self, obj):
+        if isinstance(obj, (type, types.FunctionType)) and obj.__module__ == '__main__':
+            raise pickle.PicklingError(f'{obj.__qualname__} is defined in the main module, which other interpreters '
+                                      'cannot import.')
+        return None
+
+
+def dumps(obj) -> bytes:
+    file = io.BytesIO()
+    Pickler(file).dump(obj)
+    return file.getvalue()
+
+
+def referenced_names(code: types.CodeType) -> set[str]:
+    """
+    Return the global names the given code, and the code nested in it, may refer to.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= referenced_names(const)
+    return names
+
+
+def share(value, namespace: dict):
+    """
+    Return the given value in a form other interpreters can rebuild with `unshare`: modules are imported again,
+    functions of the main module are rebuilt from their code, with their globals added to the given namespace, and
+    other objects are pickled.
+    """
+    if value is _EMPTY:
+        return ('empty',)
+    if isinstance(value, types.ModuleType):
+        return ('module', value.__name__)
+    if isinstance(value, types.FunctionType) and value.__module__ == '__main__' and not value.__closure__:
+        capture_globals(value.__code__, value.__globals__, namespace)
+        return ('function', marshal.dumps(value.__code__), value.__name__, dumps(value.__defaults__))
+    return ('object', dumps(value))
+
+
+def unshare(shared: tuple, namespace: dict):
+    """
+    Rebuild a value shared by `share`, with the given namespace as the globals of its functions.
+    """
+    kind, *data = shared
+    if kind == 'empty':
+        return _EMPTY
+    if kind == 'module':
+        return importlib.import_module(data[0])
+    if kind == 'function':
+        code, name, defaults = data
+        return types.FunctionType(marshal.loads(code), namespace, name, pickle.loads(defaults))
+    return pickle.loads(data[0])
+
+
+def capture_globals(code: types.CodeType, globs: dict, namespace: dict):
+    """
+    Add the globals the given code refers to to the given namespace, shared with `share`.
+    """
+    for name in referenced_names(code):
+        if name not in namespace and name in globs:
+            # The name is reserved first, as functions can refer to each other.
+            namespace[name] = None
+            namespace[name] = share(globs[name], namespace)
+
+
+def capture(func: types.FunctionType, args, kwargs) -> bytes:
+    """
+    Return the region function, its arguments and the ICVs of the encountering thread in a form other interpreters can
+    rebuild. Raise an exception if they are not all shareable.
+    """
+    namespace = {}
+    capture_globals(func.__code__, func.__globals__, namespace)
+    closure = [share(_cell_value(cell), namespace) for cell in func.__closure__ or ()]
+
+    icv = threading.current_thread().icv
+    parent = {name: getattr(icv, name) for name in omp.core.primitives.InternalControlVariables.inherited
+              + ('bind_var', 'levels_var', 'active_levels_var', 'ancestor_thread_nums', 'ancestor_team_sizes')}
+
+    return dumps((marshal.dumps(func.__code__), func.__name__, namespace, closure, args, kwargs, parent))
+
+
+def rebuild(payload: bytes):
+    """
+    Rebuild the region function and its arguments captured by `capture`.
+    """
+    code, name, captured, closure, args, kwargs, parent = pickle.loads(payload)
+
+    namespace = {'__builtins__': builtins, '__name__': '__omp_region__'}
+    for global_name, shared in captured.items():
+        namespace[global_name] = unshare(shared, namespace)
+
+    values = [unshare(shared, namespace) for shared in closure]
+    cells = tuple(types.CellType() if value is _EMPTY else types.CellType(value) for value in values)
+    func = types.FunctionType(marshal.loads(code), namespace, name, None, cells)
+    return func, args, kwargs, types.SimpleNamespace(**parent)
+
+
+# The code run by each member, in its interpreter. Only a few types can be shared with it: bytes, str and int.
+MEMBER_SCRIPT = 'import omp.core.interpreters\nomp.core.interpreters._member_main(payload, member)\n'
+
+
+def _member_main(payload: bytes, member: bytes):
+    """
+    Entry point of the members of a team of interpreters.
+    """
+    rank, size, (arrivals, release, lock_read, lock_write), result_path = pickle.loads(member)
+
+    try:
+        func, args, kwargs, parent = rebuild(payload)
+    except Exception:
+        # Nothing of the region ran: the team can fall back to the thread backend.
+        _write_result(result_path, ('unshareable', traceback.format_exc()))
+        return
+
+    team = InterpreterTeam(size, PipeBarrier(rank, arrivals, release), PipeLock(lock_read, lock_write))
+
+    thread = threading.current_thread()
+    thread.rank = rank
+    thread.team = team
+    thread.icv = omp.core.primitives.InternalControlVariables(thread, parent)
+    thread.workshare_count = 0
+    thread.task = Task()
+    thread.omp_parsing = False
+
+    # Nested regions are run by threads of the team member.
+    omp.set_backend('thread')
+
+    cells = _shared_cells(func)
+    before = {name: _cell_value(cell) for name, cell in cells.items()}
+
+    error = None
+    try:
+        func(*args, **kwargs)
+    except BaseException:
+        team.barrier.abort()
+        error = traceback.format_exc()
+
+    written = _written(cells, before)
+    try:
+        _write_result(result_path, ('done', (rank, team.partials, written, error)))
+    except Exception:
+        _write_result(result_path, ('done', (rank, [], written, traceback.format_exc())))
+
+
+def _write_result(path, result):
+    with open(path, 'wb') as file:
+        file.write(dumps(result))
+
+
+# Idle interpreters, which already imported the library, reused by the next teams.
+_pool = []
+_pool_lock = threading.Lock()
+
+
+def _acquire_interpreter():
+    with _pool_lock:
+        if _pool:
+            return _pool.pop()
+
+    interpreter = interpreters.create()
+    interpreters.run_string(interpreter, f'import sys\nsys.path[:] = {sys.path!r}\nimport omp.core.interpreters\n')
+    return interpreter
+
+
+def _release_interpreter(interpreter):
+    with _pool_lock:
+        _pool.append(interpreter)
+
+
+@atexit.register
+def _destroy_interpreters():
+    with _pool_lock:
+        while _pool:
+            interpreters.destroy(_pool.pop())
+
+
+def _coordinate(size, arrivals, releases):
+    """
+    Release the members of a team waiting at the barrier once all of them arrived, until they are all done.
+
+    A member done while the others wait, such as one which could not rebuild the region, never arrives: the barrier
+    is then broken.
+    """
+    waiting = []
+    broken = False
+    done = 0
+    while done < size:
+        kind, rank = MESSAGE.unpack(os.read(arrivals, MESSAGE.size))
+        if kind == b'd':
+            done += 1
+        elif kind == b'x':
+            broken = True
+        else:
+            waiting.append(rank)
+
+        if waiting and done and len(waiting) + done == size:
+            broken = True
+        if broken or len(waiting) == size:
+            for rank in waiting:
+                os.write(releases[rank], b'x' if broken else b'r')
+            waiting.clear()
+
+
+def run(size, func, args=(), kwargs=None) -> bool:
+    """
+    Run the given region function on a team of `size` subinterpreters, then combine their reductions.
+
+    Return False, without running anything, if the region refers to objects which cannot be shared with other
+    interpreters: the region should then be run by the thread backend.
+    """
+    if not available:
+        return False
+
+    try:
+        payload = capture(func, args, kwargs or {})
+    except Exception:
+        return False
+
+    arrivals, arrivals_write = os.pipe()
+    release_pipes = [os.pipe() for _ in range(size)]
+    lock_read, lock_write = os.pipe()
+    os.write(lock_write, b'l')
+
+    result_paths = []
+    for _ in range(size):
+        descriptor, path = tempfile.mkstemp(prefix='omp-')
+        os.close(descriptor)
+        result_paths.append(path)
+
+    def member(rank, interpreter):
+        fds = (arrivals_write, release_pipes[rank][0], lock_read, lock_write)
+        shared = {'payload': payload, 'member': pickle.dumps((rank, size, fds, result_paths[rank]))}
+        try:
+            interpreters.run_string(interpreter, MEMBER_SCRIPT, shared)
+        finally:
+            _release_interpreter(interpreter)
+            os.write(arrivals_write, MESSAGE.pack(b'd', rank))
+
+    try:
+        members = [threading.Thread(target=member, args=(rank, _acquire_interpreter()), daemon=True)
+                   for rank in range(size)]
+        for thread in members:
+            thread.start()
+
+        _coordinate(size, arrivals, [write for read, write in release_pipes])
+        for thread in members:
+            thread.join()
+
+        results = []
+        for rank, path in enumerate(result_paths):
+            with open(path, 'rb') as file:
+                data = file.read()
+            results.append(pickle.loads(data) if data else ('done', (rank, [], [], 'The interpreter failed.\n')))
+    finally:
+        for descriptor in (arrivals, arrivals_write, lock_read, lock_write, *sum(release_pipes, ())):
+            os.close(descriptor)
+        for path in result_paths:
+            os.remove(path)
+
+    if all(kind == 'unshareable' for kind, report in results):
+        return False
+
+    combine(func, [report if kind == 'done' else (rank, [], [], report) for rank, (kind, report) in enumerate(results)],
+            'interpreter')
+    return True
@@ -1,6 +1,8 @@
 import ast
 import threading
 
+from omp.core.ast_tools import LocalsCollector
+
 
 class Clause:
 
@@ -17,6 +19,12 @@ class Directive:
         self.openMP = openMP
         self.clauses: list(Clause) = []
 
+        # The arguments given between parentheses right after the directive name, such as the name of `critical(name)`.
+        self.arguments = ''
+
+        # The local variables of the function enclosing the construct, provided when the function is transformed.
+        self.enclosing_locals = set()
+
         self.privates = set()
         self.nowait = False
         self.reduction = dict()
@@ -65,28 +73,12 @@ class Directive:
                 )
             )]
 
-    # @staticmethod
     def list_locals(self, body: list[ast.AST]) -> list[str]:
         """
         Return a list of the local variables used in the given function body.
         """
-
-        template = """\
-def _omp_internal_inner_func():
-    pass
-"""
-
-        ast_template = ast.parse(template, mode='exec')
-
-        inner_func = ast_template.body[0]
-
-        inner_func.body = Directive.replace(inner_func.body, body)
-
-        # To find the list of local variables defined in the function, we need to compile it.
-        globs, locs = dict(), dict()
-        exec(compile(ast_template, '<OMP Parser>', mode='exec'), globs, locs)
-
-        return [varname for varname in set(locs['_omp_internal_inner_func'].__code__.co_varnames + locs['_omp_internal_inner_func'].__code__.co_cellvars) - self.privates if not varname.startswith('_omp_internal')]
+        return [varname for varname in LocalsCollector.collect(body)
+                if varname not in self.privates and not varname.startswith('_omp_internal')]
 
 
 class OpenMP:
@@ -141,13 +133,21 @@ class OpenMP:
         args = ''
 
         if i < len(clauses):
-            j = i + 1
+            # Clauses without arguments are directly followed by the next clause.
+            j = i
             if clauses[i] == '(':
+                j = i + 1
+                # The arguments can contain parentheses themselves, as in `if(len(items) > 10)`.
+                depth = 1
                 while j < len(clauses):
-                    if clauses[j] == ')':
-                        break
+                    if clauses[j] == '(':
+                        depth += 1
+                    elif clauses[j] == ')':
+                        depth -= 1
+                        if depth == 0:
+                            break
                     j += 1
-            args = clauses[i+1:j]
+                args = clauses[i+1:j]
             self.parse_clauses(clauses[j+1:].strip(',').strip(), directive)
 
         if clause in self.clauses:
@@ -156,7 +156,7 @@ class OpenMP:
                 cls(self.dir_impl, args)
 
     def __init__(self, arg: str = ''):
-        words: list(str) = arg.split()
+        words: list(str) = arg.replace('(', ' (', 1).split()
 
         directive: str = words[0] if words else arg
 
@@ -169,7 +169,11 @@ class OpenMP:
         if directive in OpenMP.directives:
             self.dir_impl = OpenMP.directives[directive](self)
             self.clause_str = arg[len(directive):].strip()
-            self.parse_clauses(arg[len(directive):].strip(), directive)
+            if self.clause_str.startswith('('):
+                end = self.clause_str.index(')')
+                self.dir_impl.arguments = self.clause_str[1:end].strip()
+                self.clause_str = self.clause_str[end + 1:].strip()
+            self.parse_clauses(self.clause_str, directive)
 
         if not threading.current_thread().omp_parsing and self.dir_impl is not None:
             self.dir_impl.run()
@@ -1,9 +1,12 @@
 import omp
+import multiprocessing
 import os
+import sys
 import threading
 from enum import Enum
 
 import omp.core.threading
+from omp.core import affinity
 
 
 class Sched(Enum):
@@ -14,20 +17,28 @@ class Sched(Enum):
     runtime = 5
 
 
+def parse_schedule(value: str):
+    """
+    Parse a `kind[,chunk]` schedule specification, such as the value of OMP_SCHEDULE.
+    """
+    kind, _, chunk = value.partition(',')
+    return Sched[kind.strip()], int(chunk) if chunk.strip() else None
+
+
 class InternalControlVariables:
 
-    num_procs_var = os.cpu_count()
+    """
+    The internal control variables of a thread.
 
-    _OMP_NUM_THREADS = 'OMP_NUM_THREADS'
-    _nthreads_var = num_procs_var if _OMP_NUM_THREADS not in os.environ else int(os.environ[_OMP_NUM_THREADS])
+    The data environment ICVs are held by each thread, which inherits them from the thread that encountered the
+    parallel region it runs. Their class attributes are the initial values, set from the environment.
+    The device ICVs are shared by all the threads.
+    """
 
-    @property
-    def nthreads_var(self):
-        return InternalControlVariables._nthreads_var
+    num_procs_var = os.cpu_count()
 
-    @nthreads_var.setter
-    def nthreads_var(self, value):
-        InternalControlVariables._nthreads_var = value
+    _OMP_NUM_THREADS = 'OMP_NUM_THREADS'
+    nthreads_var = num_procs_var if _OMP_NUM_THREADS not in os.environ else int(os.environ[_OMP_NUM_THREADS])
 
     _OMP_NUM_TEAMS = 'OMP_NUM_TEAMS'
     _nteams_var = 0 if _OMP_NUM_TEAMS not in os.environ else int(os.environ[_OMP_NUM_TEAMS])
@@ -41,23 +52,74 @@ class InternalControlVariables:
         InternalControlVariables._nteams_var = value
 
     _OMP_SCHEDULE = 'OMP_SCHEDULE'
-    _run_sched_var = (Sched.dynamic, 1) if _OMP_SCHEDULE not in os.environ else (Sched[os.environ[_OMP_SCHEDULE]], 1)
+    run_sched_var = (Sched.dynamic, None) if _OMP_SCHEDULE not in os.environ else parse_schedule(os.environ[_OMP_SCHEDULE])
 
-    @property
-    def run_sched_var(self):
-        return InternalControlVariables._run_sched_var
+    _OMP_BACKEND = 'OMP_BACKEND'
+    backend_var = 'thread' if _OMP_BACKEND not in os.environ else os.environ[_OMP_BACKEND]
+
+    _OMP_MAX_ACTIVE_LEVELS = 'OMP_MAX_ACTIVE_LEVELS'
+    # Nested parallel regions are serialized by default, so that every thread of a team does not start a team of its own.
+    max_active_levels_var = 1 if _OMP_MAX_ACTIVE_LEVELS not in os.environ else int(os.environ[_OMP_MAX_ACTIVE_LEVELS])
+
+    _OMP_THREAD_LIMIT = 'OMP_THREAD_LIMIT'
+    thread_limit_var = sys.maxsize if _OMP_THREAD_LIMIT not in os.environ else int(os.environ[_OMP_THREAD_LIMIT])
+
+    # The policies binding the threads of the parallel regions to places, for each nesting level.
+    bind_var = affinity.default_bind
+
+    # The places available to the thread, as place numbers, and the place it is bound to, or -1.
+    place_partition_var = tuple(range(len(affinity.places)))
+    place_num_var = -1
+
+    # The nesting of the parallel regions enclosing the thread, and its number and team size in each of them.
+    # The initial thread runs the implicit parallel region, at level 0.
+    levels_var = 0
+    active_levels_var = 0
+    ancestor_thread_nums = (0,)
+    ancestor_team_sizes = (1,)
+
+    # Whether waiting threads should rather spin, `active`, or sleep, `passive`. Device-global, as it is only read
+    # when teams are created.
+    _OMP_WAIT_POLICY = 'OMP_WAIT_POLICY'
+    wait_policy_var = os.environ.get(_OMP_WAIT_POLICY, '').strip().lower()
 
-    @run_sched_var.setter
-    def run_sched_var(self, value):
-        InternalControlVariables._run_sched_var = value
+    # Whether the cancel directives take effect. Device-global, as in the OpenMP specification.
+    _OMP_CANCELLATION = 'OMP_CANCELLATION'
+    cancel_var = os.environ.get(_OMP_CANCELLATION, '').strip().lower() == 'true'
 
-    def __init__(self, thread: 'omp.core.threading.Thread'):
+    # The data environment ICVs.
+    inherited = ('nthreads_var', 'run_sched_var', 'backend_var', 'max_active_levels_var', 'thread_limit_var',
+                 'place_partition_var')
+
+    def __init__(self, thread: 'omp.core.threading.Thread', parent: 'InternalControlVariables' = None):
         self.thread_num_var = thread.rank
         self.team_size_var = thread.team.size
 
+        if parent is not None:
+            self.inherit(parent)
+
+    def inherit(self, parent: 'InternalControlVariables'):
+        """
+        Copy the data environment ICVs of the given thread, which encountered the parallel region of this thread.
+        """
+        for name in self.inherited:
+            setattr(self, name, getattr(parent, name))
+
+        # Each nested region uses the next binding policy, and the last one once they are exhausted.
+        self.bind_var = parent.bind_var[1:] or parent.bind_var
+
+        self.levels_var = parent.levels_var + 1
+        self.active_levels_var = parent.active_levels_var + (self.team_size_var > 1)
+        self.ancestor_thread_nums = parent.ancestor_thread_nums + (self.thread_num_var,)
+        self.ancestor_team_sizes = parent.ancestor_team_sizes + (self.team_size_var,)
+
+
+# Execution backends of the parallel regions.
+backends = ('thread', 'process', 'interpreter')
+
 
 def get_num_procs():
-    return threading.current_thread().icv.numprocs_var
+    return threading.current_thread().icv.num_procs_var
 
 
 def set_num_threads(n: int):
@@ -88,9 +150,104 @@ def get_dynamic():
     return False
 
 
-def set_schedule(kind: Sched, chunk=1):
+def get_cancellation():
+    return threading.current_thread().icv.cancel_var
+
+
+def set_max_active_levels(max_levels: int):
+    threading.current_thread().icv.max_active_levels_var = max_levels
+
+
+def get_max_active_levels():
+    return threading.current_thread().icv.max_active_levels_var
+
+
+def get_thread_limit():
+    return threading.current_thread().icv.thread_limit_var
+
+
+def get_proc_bind():
+    """
+    Return the policy binding the threads of the next parallel region: `false`, `true`, `primary`, `close` or `spread`.
+    """
+    return threading.current_thread().icv.bind_var[0]
+
+
+def get_num_places():
+    return len(affinity.places)
+
+
+def get_place_num_procs(place_num: int):
+    return len(affinity.places[place_num]) if 0 <= place_num < len(affinity.places) else 0
+
+
+def get_place_proc_ids(place_num: int):
+    return list(affinity.places[place_num]) if 0 <= place_num < len(affinity.places) else []
+
+
+def get_place_num():
+    """
+    Return the place the current thread is bound to, or -1 if it is not bound.
+    """
+    return threading.current_thread().icv.place_num_var
+
+
+def get_partition_num_places():
+    return len(threading.current_thread().icv.place_partition_var)
+
+
+def get_partition_place_nums():
+    return list(threading.current_thread().icv.place_partition_var)
+
+
+def get_level():
+    return threading.current_thread().icv.levels_var
+
+
+def get_active_level():
+    return threading.current_thread().icv.active_levels_var
+
+
+def get_ancestor_thread_num(level: int):
+    """
+    Return the number of the ancestor of the current thread in the parallel region at the given nesting level,
+    or -1 if there is no such level.
+    """
+    icv = threading.current_thread().icv
+    return icv.ancestor_thread_nums[level] if 0 <= level <= icv.levels_var else -1
+
+
+def get_team_size(level: int):
+    """
+    Return the size of the team of the ancestor of the current thread at the given nesting level,
+    or -1 if there is no such level.
+    """
+    icv = threading.current_thread().icv
+    return icv.ancestor_team_sizes[level] if 0 <= level <= icv.levels_var else -1
+
+
+def set_schedule(kind: Sched, chunk=None):
     threading.current_thread().icv.run_sched_var = (kind, chunk)
 
 
 def get_schedule():
     return threading.current_thread().icv.run_sched_var
+
+
+def set_backend(name: str):
+    """
+    Select how parallel regions are executed: by a team of threads (`thread`), of forked processes (`process`), or of
+    subinterpreters with their own GIL (`interpreter`).
+    """
+    if name not in backends:
+        raise ValueError(f'Unknown backend {name!r}, expected one of {", ".join(backends)}.')
+    if name == 'process' and 'fork' not in multiprocessing.get_all_start_methods():
+        raise ValueError('The process backend requires the fork start method, which is not available on this platform.')
+    if name == 'interpreter' and not omp.core.interpreters.available:
+        raise ValueError('The interpreter backend requires Python 3.12 or later, whose subinterpreters have their own '
+                         'GIL.')
+    threading.current_thread().icv.backend_var = name
+
+
+def get_backend():
+    return threading.current_thread().icv.backend_var
@@ -0,0 +1,147 @@
+import multiprocessing
+import threading
+import traceback
+
+import omp.core.primitives
+from omp.core.threading import Team
+import omp
+
+
+class ProcessTeam(Team):
+
+    """
+    Represents a team of forked processes.
+
+    Each team member runs the region function in its own copy of the parent's memory, which bypasses the GIL.
+    The parent only gets back the partial results of the reductions: any other write to a shared variable is lost, and
+    reported as an error.
+    """
+
+    shares_memory = False
+
+    def __init__(self, size, context):
+        super().__init__(size=0)
+
+        self.size = size
+        self.barrier = context.Barrier(size)
+        self.lock = context.Lock()
+
+        # Partial results of the reductions run by the current team member, as (name, operator, value) tuples.
+        self.partials = []
+
+
+def _member_main(team: ProcessTeam, rank, func, args, kwargs, results):
+    """
+    Entry point of the forked team members.
+    """
+    thread = threading.current_thread()
+    thread.rank = rank
+    thread.team = team
+    thread.icv = omp.core.primitives.InternalControlVariables(thread, thread.icv)
+    thread.workshare_count = 0
+
+    # Nested regions are run by threads of the team member.
+    omp.set_backend('thread')
+
+    cells = _shared_cells(func)
+    before = {name: _cell_value(cell) for name, cell in cells.items()}
+
+    error = None
+    try:
+        func(*args, **kwargs)
+    except BaseException:
+        team.barrier.abort()
+        error = traceback.format_exc()
+
+    results.put((rank, team.partials, _written(cells, before), error))
+
+
+_EMPTY = object()
+
+
+def _cell_value(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _EMPTY
+
+
+def _written(cells, before):
+    """
+    Return the names of the shared variables bound before the region which the region assigned.
+
+    Variables first bound in the region are private to each team member, as the parent never sees them: they are not
+    reported.
+    """
+    return [name for name, cell in cells.items() if before[name] is not _EMPTY and _cell_value(cell) is not before[name]]
+
+
+def _shared_cells(func):
+    """
+    Map the names of the variables the region function shares with its enclosing scope to their cells.
+    """
+    return dict(zip(func.__code__.co_freevars, func.__closure__ or ()))
+
+
+def run(size, func, args=(), kwargs=None):
+    """
+    Run the given region function on a team of `size` forked processes, then combine their reductions.
+    """
+    context = multiprocessing.get_context('fork')
+    team = ProcessTeam(size, context)
+    results = context.SimpleQueue()
+
+    members = [context.Process(target=_member_main, args=(team, rank, func, args, kwargs or {}, results))
+               for rank in range(size)]
+    for member in members:
+        member.start()
+
+    # The results have to be read before joining, so that no member blocks on a full pipe.
+    reports = sorted(results.get() for _ in members)
+    for member in members:
+        member.join()
+
+    combine(func, reports, 'process')
+
+
+class RemoteTraceback(Exception):
+
+    """
+    The formatted traceback of an exception raised by a member of a team not sharing memory with the parent.
+    """
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.text = text
+
+    def __str__(self):
+        return f'\n\n{self.text}'
+
+
+def combine(func, reports, backend):
+    """
+    Combine the reductions reported by the members of a team not sharing memory, as (rank, partials, written names,
+    error) tuples, into the variables the given region function shares with its enclosing scope.
+    The first error of the members is raised in the parent instead, with the traceback of the member as its cause.
+    """
+    errors = [(rank, error) for rank, partials, names, error in reports if error is not None]
+    if errors:
+        # The other members only see the barrier aborted by the member which failed first.
+        rank, error = min(errors, key=lambda report: report[1].rstrip().endswith('BrokenBarrierError'))
+        raise RuntimeError(f'Exception in {backend} {rank} of the team.') from RemoteTraceback(error)
+
+    written = set()
+    for rank, partials, names, error in reports:
+        written.update(names)
+
+    if written:
+        raise RuntimeError(f'The {backend} backend cannot propagate writes to shared variables, but the parallel region '
+                           f'assigned {", ".join(sorted(written))}. Use a reduction, or the thread backend.')
+
+    cells = _shared_cells(func)
+    for rank, partials, names, error in reports:
+        for name, operator, value in partials:
+            if name not in cells:
+                raise RuntimeError(f'The reduction variable {name} must be shared with the parallel region to be '
+                                   f'combined by the {backend} backend.')
+            cells[name].cell_contents = omp.clauses.reduction.operators[operator](cells[name].cell_contents, value)
@@ -0,0 +1,140 @@
+import atexit
+import json
+import os
+import threading
+import time
+
+import omp.core.tools as tools
+
+
+class Profiler:
+
+    """
+    Records the events of the runtime through the tool callbacks, to summarize the time spent by each thread working,
+    waiting at barriers and for locks, or to export a trace viewable in chrome://tracing or Perfetto.
+
+    Can be used as a context manager, profiling its body:
+
+        with omp.Profiler() as profiler:
+            work()
+        print(profiler.report())
+        profiler.write_trace('trace.json')
+    """
+
+    def __init__(self):
+        # Recorded events, as (timestamp, thread identifier, thread name, event, information) tuples.
+        self.records = []
+        self.origin = time.perf_counter()
+
+    def record(self, event: str, **info):
+        thread = threading.current_thread()
+        # Appending to a list is atomic, so that the threads do not need to synchronize.
+        self.records.append((time.perf_counter(), thread.native_id, thread.name, event, info))
+
+    def start(self):
+        """
+        Start recording the events of the runtime.
+        """
+        self.origin = time.perf_counter()
+        for event in tools.events:
+            tools.register(event, self.record)
+        return self
+
+    def stop(self):
+        """
+        Stop recording the events of the runtime.
+        """
+        for event in tools.events:
+            tools.unregister(event, self.record)
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def stats(self) -> dict:
+        """
+        Summarize the recorded events of each thread: the time spent in parallel regions, in worksharing constructs,
+        waiting at barriers and for locks, in seconds, and the numbers of chunks and iterations it was handed out.
+        """
+        stats = {}
+        begins = {}
+        spans = {'implicit_task_end': ('implicit_task_begin', 'region'), 'work_end': ('work_begin', 'work'),
+                 'sync_wait_end': ('sync_wait_begin', 'wait'), 'lock_acquired': ('lock_acquire', 'lock_wait')}
+        starts = {begin for begin, key in spans.values()}
+
+        for timestamp, tid, name, event, info in self.records:
+            thread = stats.setdefault(name, {'region': 0.0, 'work': 0.0, 'wait': 0.0, 'lock_wait': 0.0, 'locks': 0,
+                                             'chunks': 0, 'iterations': 0})
+            if event in spans:
+                begin, key = spans[event]
+                stack = begins.get((tid, begin))
+                if stack:
+                    thread[key] += timestamp - stack.pop()
+                thread['locks'] += event == 'lock_acquired'
+            elif event == 'dispatch':
+                thread['chunks'] += 1
+                thread['iterations'] += info['iterations']
+            elif event in starts:
+                begins.setdefault((tid, event), []).append(timestamp)
+
+        return stats
+
+    def report(self) -> str:
+        """
+        Return a table of the statistics of each thread.
+        """
+        header = ('thread', 'region (s)', 'work (s)', 'wait (s)', 'lock wait (s)', 'locks', 'chunks', 'iterations')
+        lines = ['{:<16}{:>12}{:>12}{:>12}{:>15}{:>8}{:>8}{:>12}'.format(*header)]
+        for name, thread in self.stats().items():
+            lines.append(f'{name[:15]:<16}{thread["region"]:>12.6f}{thread["work"]:>12.6f}{thread["wait"]:>12.6f}'
+                         f'{thread["lock_wait"]:>15.6f}{thread["locks"]:>8}{thread["chunks"]:>8}'
+                         f'{thread["iterations"]:>12}')
+        return '\n'.join(lines)
+
+    def trace(self) -> dict:
+        """
+        Return the recorded events in the Chrome trace event format.
+        """
+        pid = os.getpid()
+        trace = []
+        names = {}
+        phases = {'parallel_begin': ('B', 'parallel'), 'parallel_end': ('E', 'parallel'),
+                  'implicit_task_begin': ('B', 'implicit task'), 'implicit_task_end': ('E', 'implicit task'),
+                  'lock_acquire': ('B', 'lock wait'), 'lock_acquired': ('E', 'lock wait'),
+                  'dispatch': ('i', 'dispatch')}
+
+        for timestamp, tid, name, event, info in self.records:
+            names[tid] = name
+            if event in ('work_begin', 'work_end', 'sync_wait_begin', 'sync_wait_end'):
+                phase, label = 'B' if event.endswith('begin') else 'E', info['kind']
+            elif event in phases:
+                phase, label = phases[event]
+            else:
+                continue
+
+            entry = {'name': label, 'ph': phase, 'ts': (timestamp - self.origin) * 1e6, 'pid': pid, 'tid': tid,
+                     'args': info}
+            if phase == 'i':
+                entry['s'] = 't'
+            trace.append(entry)
+
+        trace.extend({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                     for tid, name in names.items())
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, path: str):
+        """
+        Write the recorded events to the given file, in the Chrome trace event format.
+        """
+        with open(path, 'w') as file:
+            json.dump(self.trace(), file)
+
+
+# The whole program is profiled when OMP_TRACE is set, and its trace is written to the given path on exit.
+_OMP_TRACE = 'OMP_TRACE'
+if os.environ.get(_OMP_TRACE):
+    _profiler = Profiler().start()
+    atexit.register(_profiler.write_trace, os.environ[_OMP_TRACE])
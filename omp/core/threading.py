@@ -1,8 +1,87 @@
+import collections
+import itertools
+import os
+import sys
 import threading
+import time
 
 import omp.core.primitives
 import omp
 
+# Free-threaded builds of CPython can run without the GIL, which the runtime then cannot rely on for atomicity.
+GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+class LockedCounter:
+
+    """
+    Replacement for itertools.count which threads can share without the GIL.
+
+    Python offers no lock-free primitive to take the next number, so each call to next takes a lock: concurrent threads
+    are serialized on it, which costs more than the single atomic operation the GIL gives itertools.count.
+    """
+
+    def __init__(self, start=0, step=1):
+        self.value = start
+        self.step = step
+        self.lock = threading.Lock()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self.lock:
+            value = self.value
+            self.value = value + self.step
+        return value
+
+
+class SpinLock:
+
+    """
+    A lock that tries to be acquired several times before blocking.
+
+    This avoids putting threads to sleep for short critical sections, where the lock is released quickly.
+    """
+
+    spins = 100
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        for _ in range(self.spins):
+            if self.lock.acquire(blocking=False):
+                return True
+            if GIL_ENABLED:
+                # The owner of the lock needs the GIL to release it.
+                time.sleep(0)
+        return self.lock.acquire()
+
+    def release(self):
+        self.lock.release()
+
+    def locked(self):
+        return self.lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def counter(start=0, step=1):
+    """
+    Return an iterator over evenly spaced numbers, whose next number can be taken by concurrent threads.
+
+    Without the GIL, this is a LockedCounter, so taking a number is thread-safe but not lock-free.
+    """
+    if GIL_ENABLED:
+        # Calling next on an itertools.count is atomic under the GIL.
+        return itertools.count(start, step)
+    return LockedCounter(start, step)
+
 
 class Thread(threading.Thread):
     """
@@ -13,8 +92,191 @@ class Thread(threading.Thread):
         super().__init__(*args, **kwargs)
         self.rank = rank
         self.team: Team = team
-        self.icv = omp.core.primitives.InternalControlVariables(self)
+        # The thread inherits the ICVs of the thread creating it.
+        self.icv = omp.core.primitives.InternalControlVariables(self, getattr(threading.current_thread(), 'icv', None))
         self.omp_parsing = False
+        self.workshare_count = 0
+        self.task = Task()
+
+
+class Task:
+
+    """
+    An explicit task, or the implicit task run by a thread of a team.
+    """
+
+    __slots__ = ('func', 'parent', 'final', 'group', 'taskgroup', 'children')
+
+    def __init__(self, func=None, parent: 'Task' = None, final=False):
+        self.func = func
+        self.parent = parent
+        self.final = final
+        # The task group the task belongs to, and the innermost task group of its region, which its children join.
+        self.group = parent.taskgroup if parent is not None else None
+        self.taskgroup = self.group
+        # The number of child tasks not completed yet. Only accessed under the task condition of the team.
+        self.children = 0
+
+
+class TaskGroup:
+
+    """
+    The tasks created in a taskgroup region, and their descendants.
+    """
+
+    __slots__ = ('pending',)
+
+    def __init__(self):
+        # The number of tasks of the group not completed yet. Only accessed under the task condition of the team.
+        self.pending = 0
+
+
+class CancelledRegion(BaseException):
+
+    """
+    Raised in the threads of a cancelled parallel region at their next cancellation point, to leave the region.
+    """
+
+
+class Barrier:
+
+    """
+    An epoch-based barrier of the threads of a team, which execute the pending tasks of the team while they wait.
+
+    Each thread takes a ticket from a shared counter when it arrives. The thread taking the last ticket of an epoch
+    releases the others by starting the next epoch, once all the tasks of the team are completed.
+    Waiting threads spin for a while, depending on the wait policy, before going to sleep.
+    It implements the part of the interface of threading.Barrier used by the runtime.
+    """
+
+    # The number of times waiting threads check the barrier before sleeping, for each wait policy.
+    # Without a policy, threads only spin when the team does not outnumber the processors, as a spinning thread
+    # would otherwise take the processor of the thread it waits for.
+    policy_spins = {'active': 10000, 'passive': 0}
+    default_spins = 100
+
+    def __init__(self, team: 'Team', parties):
+        self.team = team
+        self.parties = parties
+        self.reset()
+
+    def wait(self):
+        if omp.core.tools.enabled:
+            omp.core.tools.emit('sync_wait_begin', kind='barrier')
+            try:
+                self.wait_epoch()
+            finally:
+                omp.core.tools.emit('sync_wait_end', kind='barrier')
+            return
+
+        self.wait_epoch()
+
+    def wait_epoch(self):
+        # Barriers are cancellation points: the threads of a cancelled region no longer wait for each other.
+        if self.team.cancelled:
+            raise CancelledRegion
+
+        epoch, position = divmod(next(self.tickets), self.parties)
+        if position == self.parties - 1:
+            if self.team.pending_tasks:
+                # The barrier is released by the thread completing the last task.
+                with self.team.tasks_condition:
+                    self.complete = epoch
+                    if self.team.pending_tasks == 0:
+                        self.release()
+            else:
+                self.release()
+
+        team = self.team
+        thread = threading.current_thread()
+        spins = self.spins()
+        while self.epoch == epoch:
+            if self.broken:
+                raise threading.BrokenBarrierError
+            if team.cancelled:
+                raise CancelledRegion
+
+            if team.pending_tasks:
+                task = team.next_task(thread.rank)
+                if task is not None:
+                    team.run_task(thread, task)
+                    continue
+
+            if spins:
+                spins -= 1
+                if GIL_ENABLED:
+                    # The other threads need the GIL to arrive.
+                    time.sleep(0)
+                continue
+
+            with team.tasks_condition:
+                if self.epoch == epoch and not self.broken and not team.cancelled and not any(team.deques):
+                    team.idle += 1
+                    team.tasks_condition.wait()
+                    team.idle -= 1
+
+        if self.broken:
+            raise threading.BrokenBarrierError
+
+    def spins(self):
+        icv = omp.core.primitives.InternalControlVariables
+        if icv.wait_policy_var in self.policy_spins:
+            return self.policy_spins[icv.wait_policy_var]
+        return self.default_spins if self.parties <= (icv.num_procs_var or 1) else 0
+
+    def release(self):
+        """
+        Start the next epoch, releasing the waiting threads.
+        """
+        # Sleeping threads check the epoch and count themselves idle under the task condition, so the epoch is
+        # published under it too: otherwise, a thread checking the old epoch could go to sleep unnoticed.
+        with self.team.tasks_condition:
+            self.complete = None
+            self.epoch += 1
+            if self.team.idle:
+                self.team.tasks_condition.notify_all()
+
+    def release_if_complete(self):
+        """
+        Release the barrier if all the threads arrived. Must be called under the task condition of the team, once all
+        the tasks are completed.
+        """
+        if self.complete == self.epoch:
+            self.release()
+
+    def abort(self):
+        with self.team.tasks_condition:
+            self.broken = True
+            self.team.tasks_condition.notify_all()
+
+    def reset(self):
+        self.tickets = counter()
+        self.epoch = 0
+        # The epoch whose threads all arrived, waiting for the tasks to complete.
+        self.complete = None
+        self.broken = False
+
+
+class Workshare:
+
+    """
+    State shared by the threads of a team executing the same worksharing construct.
+    """
+
+    # Set once a thread of the team cancelled the construct.
+    cancelled = False
+
+    def __init__(self, team: 'Team', index: int):
+        self.team = team
+        self.index = index
+        self.left = counter(1)
+
+    def leave(self):
+        """
+        Called by each thread of the team once it is done with the construct. The last one discards the state.
+        """
+        if next(self.left) == self.team.size:
+            del self.team.workshares[self.index]
 
 
 class Team:
@@ -25,6 +287,9 @@ class Team:
 
     OMP_NUM_THREADS = 'OMP_NUM_THREADS'
 
+    # Whether the team members run in the same process, and can share the state of the worksharing constructs.
+    shares_memory = True
+
     def __init__(self, size=None, *args, **kwargs):
 
         # The default team size is set by the OMP_NUM_THREADS environment variable.
@@ -35,14 +300,130 @@ class Team:
         self.size = size
         self.threads = [Thread(i, self, *args, **kwargs) for i in range(self.size)]
 
+        # Guards the task counters of the team, of its tasks and task groups, and the release of the barrier once the
+        # tasks are completed. It is reentrant, as the barrier can be released by a thread holding it.
+        self.tasks_condition = threading.Condition(threading.RLock())
+        self.reset_tasks()
+
         if size > 0:
-            self.barrier = threading.Barrier(size)
+            self.barrier = Barrier(self, size)
         self.lock = threading.Lock()
 
-        # ALERT: Access atomically.
-        self.singleThread = None
+        self.workshares = {}
+        # Set once a thread of the team cancelled the parallel region.
+        self.cancelled = False
+
+    def workshare(self, cls, *args):
+        """
+        Return the state of the worksharing construct the current thread is entering.
+
+        Every thread counts the worksharing constructs it encounters, so that the n-th construct of each thread is the
+        same construct. The first thread to reach it creates its state by calling `cls(team, index, *args)`.
+        """
+        thread = threading.current_thread()
+        index = thread.workshare_count
+        thread.workshare_count = index + 1
+
+        state = self.workshares.get(index)
+        if state is None:
+            state = self.workshares.setdefault(index, cls(self, index, *args))
+        return state
+
+    def reset_tasks(self):
+        # Each thread pushes and pops the tasks it creates at the end of its own deque. Idle threads steal them from
+        # the beginning of the deques of the other threads.
+        self.deques = [collections.deque() for _ in range(self.size)]
+
+        # The number of explicit tasks created and not completed yet, and the number of threads waiting for them.
+        self.pending_tasks = 0
+        self.idle = 0
+
+    def spawn(self, task: Task):
+        """
+        Queue the given task on the deque of the current thread, to be run by any thread of the team.
+        """
+        rank = threading.current_thread().rank
+        with self.tasks_condition:
+            self.pending_tasks += 1
+            task.parent.children += 1
+            if task.group is not None:
+                task.group.pending += 1
+            self.deques[rank].append(task)
+            if self.idle:
+                self.tasks_condition.notify()
 
-        self.globalvars = {}
+    def next_task(self, rank):
+        """
+        Return the last task queued by the given thread, or else a task stolen from another thread, or None.
+        """
+        own = self.deques[rank]
+        if own:
+            try:
+                return own.pop()
+            except IndexError:
+                pass
+
+        for offset in range(1, self.size):
+            victim = self.deques[(rank + offset) % self.size]
+            if victim:
+                try:
+                    return victim.popleft()
+                except IndexError:
+                    pass
+
+        return None
+
+    def run_task(self, thread: Thread, task: Task):
+        """
+        Run the given queued task on the given thread of the team.
+        """
+        previous = thread.task
+        thread.task = task
+        try:
+            task.func()
+        finally:
+            thread.task = previous
+            with self.tasks_condition:
+                self.pending_tasks -= 1
+                task.parent.children -= 1
+                if task.group is not None:
+                    task.group.pending -= 1
+                if self.pending_tasks == 0:
+                    self.barrier.release_if_complete()
+                if self.idle:
+                    self.tasks_condition.notify_all()
+
+    def help_until(self, done):
+        """
+        Run the queued tasks of the team on the current thread until `done()` is true.
+        """
+        thread = threading.current_thread()
+        while not done():
+            task = self.next_task(thread.rank)
+            if task is not None:
+                self.run_task(thread, task)
+                continue
+
+            with self.tasks_condition:
+                if not done() and not any(self.deques):
+                    self.idle += 1
+                    self.tasks_condition.wait()
+                    self.idle -= 1
+
+    def complete_tasks(self):
+        """
+        Help the team complete all its tasks. This happens at the end of a parallel region.
+        """
+        if self.pending_tasks:
+            self.help_until(lambda: self.pending_tasks == 0)
+
+    def cancel(self):
+        """
+        Cancel the parallel region of the team, releasing the threads waiting at its barrier.
+        """
+        with self.tasks_condition:
+            self.cancelled = True
+            self.tasks_condition.notify_all()
 
     def start(self):
         for thread in self.threads:
@@ -53,15 +434,212 @@ class Team:
             thread.join()
 
 
+class Worker(Thread):
+    """
+    A thread of the hot team.
+
+    Workers park between parallel regions instead of terminating, and are handed the next region function by
+    `HotTeam.run`.
+    """
+
+    def __init__(self, rank, team):
+        super().__init__(rank, team, name=f'omp-worker-{rank}', daemon=True)
+        self.wakeup = threading.Semaphore(0)
+        self.region = None
+
+    def assign(self, region):
+        """
+        Hand a `(func, args, kwargs)` region to the worker. A `None` region retires the worker.
+        """
+        self.region = region
+        self.wakeup.release()
+
+    def run(self):
+        while True:
+            self.wakeup.acquire()
+            if self.region is None:
+                return
+
+            func, args, kwargs = self.region
+            self.region = None
+            self.workshare_count = 0
+            self.task = Task()
+            try:
+                func(*args, **kwargs)
+            except BaseException:
+                # Threads still waiting on the team would never be released otherwise.
+                self.team.barrier.abort()
+                threading.excepthook(threading.ExceptHookArgs((*sys.exc_info(), self)))
+            finally:
+                self.team.member_done()
+
+
+class HotTeam(Team):
+
+    """
+    A team of parked worker threads reused across parallel regions.
+
+    Entering a region only wakes the workers up, instead of creating, starting and joining a thread per team member.
+    The team is resized whenever the requested number of threads changes.
+    """
+
+    def __init__(self):
+        super().__init__(size=0)
+
+        # Held while a region runs on the team. Regions that cannot get it need a team of their own.
+        self.busy = threading.Lock()
+        self.done = threading.Semaphore(0)
+        self.barrier = Barrier(self, 1)
+
+        # Called by the last worker completing the current region, instead of waking the caller up.
+        self.on_done = None
+        self.remaining = counter(1)
+
+    def resize(self, size):
+        while len(self.threads) > size:
+            self.threads.pop().assign(None)
+
+        self.size = size
+        for rank in range(len(self.threads), size):
+            worker = Worker(rank, self)
+            self.threads.append(worker)
+            worker.start()
+
+        for thread in self.threads:
+            thread.icv.team_size_var = size
+
+        self.reset_tasks()
+        self.barrier = Barrier(self, size)
+
+    def run(self, size, func, args=(), kwargs=None):
+        """
+        Run the given region function on `size` workers and wait for all of them to complete it.
+
+        The caller must hold `self.busy`.
+        """
+        self.start(size, func, args, kwargs)
+        for _ in range(size):
+            self.done.acquire()
+
+    def start(self, size, func, args=(), kwargs=None, on_done=None):
+        """
+        Start running the given region function on `size` workers, without waiting for them.
+
+        Once all of them completed it, `on_done` is called by the last one, or else `run` is woken up.
+        The caller must hold `self.busy` until then.
+        """
+        if size != self.size:
+            self.resize(size)
+        elif self.barrier.broken or self.cancelled:
+            # The tasks of a failed region are discarded.
+            self.reset_tasks()
+            self.barrier.reset()
+
+        self.workshares = {}
+        self.cancelled = False
+
+        icv = threading.current_thread().icv
+        region = (func, args, kwargs if kwargs is not None else {})
+        self.on_done = on_done
+        self.remaining = counter(1)
+        for thread in self.threads:
+            thread.icv.inherit(icv)
+            thread.assign(region)
+
+    def member_done(self):
+        """
+        Report that the current worker completed its part of the region.
+        """
+        if self.on_done is None:
+            self.done.release()
+        elif next(self.remaining) == self.size:
+            on_done, self.on_done = self.on_done, None
+            on_done()
+
+
+class SerialTeam(Team):
+
+    """
+    A team made of the current thread only, which runs the implicit parallel region or a serialized parallel region.
+    """
+
+    def __init__(self):
+        super().__init__(size=0)
+
+        self.size = 1
+        self.threads.append(threading.current_thread())
+        self.reset_tasks()
+        self.barrier = Barrier(self, 1)
+
+
+def run_serialized(func, args=(), kwargs=None):
+    """
+    Run the given region function on a team made of the current thread only.
+    """
+    thread = threading.current_thread()
+    outer = (thread.rank, thread.team, thread.icv, thread.workshare_count, thread.task)
+
+    thread.rank = 0
+    thread.team = SerialTeam()
+    thread.icv = omp.core.primitives.InternalControlVariables(thread, outer[2])
+    thread.workshare_count = 0
+    thread.task = Task()
+    try:
+        func(*args, **(kwargs or {}))
+    except CancelledRegion:
+        pass
+    finally:
+        thread.rank, thread.team, thread.icv, thread.workshare_count, thread.task = outer
+
+
+class ThreadBudget:
+
+    """
+    Counts the threads running parallel regions, so that the teams do not exceed the thread limit altogether.
+    """
+
+    def __init__(self):
+        # The initial thread.
+        self.used = 1
+        self.lock = threading.Lock()
+
+    def acquire(self, count, limit):
+        """
+        Reserve up to `count` additional threads under the given limit, and return how many were reserved.
+        """
+        with self.lock:
+            granted = max(0, min(count, limit - self.used))
+            self.used += granted
+        return granted
+
+    def release(self, count):
+        with self.lock:
+            self.used -= count
+
+
 def barrier():
     threading.current_thread().team.barrier.wait()
 
 
+hot_team = HotTeam()
+thread_budget = ThreadBudget()
+
+
+def _reset_hot_team():
+    # The workers of the parent process do not exist in a forked child.
+    global hot_team, thread_budget
+    hot_team = HotTeam()
+    thread_budget = ThreadBudget()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_hot_team)
+
+
 # Add our attributes to the main thread.
 _mainThread = threading.current_thread()
 _mainThread.rank = 0
-_mainThread.team = Team(size=0)
-_mainThread.team.size = 1
-_mainThread.barrier = threading.Barrier(1)
-_mainThread.team.threads.append(_mainThread)
+_mainThread.team = SerialTeam()
 _mainThread.omp_parsing = False
+_mainThread.workshare_count = 0
+_mainThread.task = Task()
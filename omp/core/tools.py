@@ -0,0 +1,44 @@
+# Callback interface for performance tools, in the spirit of OMPT.
+#
+# Tools register callbacks for the events of the runtime. Each callback is called on the thread where the event
+# happens, as `callback(event, **info)`, with the following information:
+#
+# - `parallel_begin`, `parallel_end`: on the thread encountering a parallel region, with the team `size`.
+# - `implicit_task_begin`, `implicit_task_end`: on each thread of the team, with its `thread_num`.
+# - `work_begin`, `work_end`: around a worksharing construct, with its `kind`, `loop` or `single`.
+# - `dispatch`: when a thread gets a chunk of a loop, with its number of `iterations`, and its `start` position when
+#   the iterable is indexable.
+# - `sync_wait_begin`, `sync_wait_end`: around a wait, with its `kind`, `barrier`, `taskwait` or `taskgroup`.
+# - `lock_acquire`, `lock_acquired`, `lock_release`: around a critical section, with its `name`.
+events = ('parallel_begin', 'parallel_end', 'implicit_task_begin', 'implicit_task_end', 'work_begin', 'work_end',
+          'dispatch', 'sync_wait_begin', 'sync_wait_end', 'lock_acquire', 'lock_acquired', 'lock_release')
+
+# Whether any callback is registered. The runtime checks it before reporting an event, so that the events cost nearly
+# nothing without tools.
+enabled = False
+
+callbacks = {event: [] for event in events}
+
+
+def register(event: str, callback):
+    """
+    Call the given callback whenever the given event happens.
+    """
+    global enabled
+
+    if event not in callbacks:
+        raise ValueError(f'Unknown event {event!r}, expected one of {", ".join(events)}.')
+    callbacks[event].append(callback)
+    enabled = True
+
+
+def unregister(event: str, callback):
+    global enabled
+
+    callbacks[event].remove(callback)
+    enabled = any(callbacks.values())
+
+
+def emit(event: str, **info):
+    for callback in callbacks[event]:
+        callback(event, **info)
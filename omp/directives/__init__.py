@@ -4,6 +4,12 @@ import omp.directives.parallel_for_construct as parallel_for_construct
 import omp.directives.single_construct as single_construct
 import omp.directives.barrier_directive as barrier_directive
 import omp.directives.critical_construct as critical_construct
+import omp.directives.atomic_construct as atomic_construct
+import omp.directives.task_construct as task_construct
+import omp.directives.sections_construct as sections_construct
+import omp.directives.parallel_sections_construct as parallel_sections_construct
+import omp.directives.ordered_construct as ordered_construct
+import omp.directives.cancel_directive as cancel_directive
 
 # Avoid linter warnings for package shortcuts definitions.
 parallel_construct
@@ -12,3 +18,9 @@ parallel_for_construct
 single_construct
 barrier_directive
 critical_construct
+atomic_construct
+task_construct
+sections_construct
+parallel_sections_construct
+ordered_construct
+cancel_directive
@@ -0,0 +1,139 @@
+from omp.core.openmp import Directive, OpenMP
+from omp.core.ast_tools import LinenoStripper
+
+import ast
+import random
+import threading
+import zlib
+
+
+@OpenMP.directive('atomic')
+class AtomicConstruct(Directive):
+
+    """
+    OpenMP atomic construct implementation.
+
+    The statement is not outlined: it runs in place, under the lock of a stripe selected by the updated variable.
+    """
+
+    form = 'update'
+
+    def target(self, statement: ast.AST):
+        """
+        Return the variable updated or written by the given statement, or None if it is neither an update nor a write.
+        """
+        if isinstance(statement, ast.AugAssign):
+            return statement.target
+
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+            target = statement.targets[0]
+            if self.form == 'write' or self.form == 'capture' and not self.is_read(statement):
+                return target
+            # Updates can also be written as `x = x op expr` or `x = expr op x`.
+            value = statement.value
+            if isinstance(value, ast.BinOp) and ast.unparse(target) in (ast.unparse(value.left), ast.unparse(value.right)):
+                return target
+
+        return None
+
+    @staticmethod
+    def is_read(statement: ast.AST):
+        """
+        Whether the given statement is a read of a variable into another, `v = x`.
+        """
+        return (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+                and isinstance(statement.value, (ast.Name, ast.Attribute, ast.Subscript)))
+
+    def error(self, message: str):
+        return SyntaxError(f'Invalid atomic {self.form} construct: {message}.')
+
+    def parse(self, node: ast.With) -> ast.AST:
+        body = node.body
+
+        if self.form == 'capture':
+            if len(body) != 2:
+                raise self.error('expected an update and a read of the updated variable')
+            read, update = body if self.is_read(body[0]) and self.target(body[1]) is not None else body[::-1]
+            target = self.target(update)
+            if not self.is_read(read) or target is None or ast.unparse(read.value) != ast.unparse(target):
+                raise self.error('expected an update and a read of the updated variable')
+        else:
+            if len(body) != 1:
+                raise self.error('expected a single statement')
+            if self.form == 'read':
+                if not self.is_read(body[0]):
+                    raise self.error('expected an assignment of the form `v = x`')
+                target = body[0].value
+            else:
+                target = self.target(body[0])
+                if target is None:
+                    raise self.error('expected an assignment to the updated variable')
+
+        if isinstance(target, ast.Name):
+            # Reading a single variable is atomic.
+            if self.form == 'read':
+                return body[0]
+            lock = f'_omp_internal.directives.atomic_construct.stripes[{stripe_index(target.id)}]'
+            return self.locked(lock, body)
+
+        # The object holding the variable, and its key, are evaluated only once, to select the lock.
+        nonce = random.randint(0, 100000)
+        obj = f'_omp_internal_atomic_obj{nonce}'
+        key = f'_omp_internal_atomic_key{nonce}'
+        if isinstance(target, ast.Attribute):
+            lock = f'_omp_internal.directives.atomic_construct.lock_for({obj} := {ast.unparse(target.value)}, {target.attr!r})'
+            replacement = f'{obj}.{target.attr}'
+        elif isinstance(target, ast.Subscript):
+            lock = f'_omp_internal.directives.atomic_construct.lock_for({obj} := {ast.unparse(target.value)}, {key} := {ast.unparse(target.slice)})'
+            replacement = f'{obj}[{key}]'
+        else:
+            raise self.error('the updated variable must be a name, an attribute or a subscript')
+
+        return self.locked(lock, [ReplaceTarget(target, replacement).visit(statement) for statement in body])
+
+    @staticmethod
+    def locked(lock: str, body: list[ast.AST]) -> ast.With:
+        """
+        Return a with statement running the given statements under the given lock.
+        """
+        with_stmt: ast.With = LinenoStripper().visit(ast.parse(f'with {lock}:\n    pass', mode='exec')).body[0]
+        with_stmt.body = body
+        return with_stmt
+
+
+class ReplaceTarget(ast.NodeTransformer):
+    """
+    Replaces the occurences of the updated variable by the given expression.
+    """
+
+    def __init__(self, target: ast.AST, replacement: str):
+        self.target = ast.unparse(target)
+        self.replacement = replacement
+
+    def visit(self, node: ast.AST):
+        if isinstance(node, (ast.Attribute, ast.Subscript)) and ast.unparse(node) == self.target:
+            replacement = LinenoStripper().visit(ast.parse(self.replacement, mode='eval').body)
+            replacement.ctx = node.ctx
+            return replacement
+        return self.generic_visit(node)
+
+
+# Atomic updates of the variables hashing to the same stripe are serialized by the same lock.
+stripes = [threading.Lock() for _ in range(128)]
+
+
+def stripe_index(name: str) -> int:
+    # Unlike hash, crc32 does not depend on the process, which matters for cached code.
+    return zlib.crc32(name.encode()) % len(stripes)
+
+
+def lock_for(obj, key):
+    """
+    Return the lock of the stripe of the given item or attribute of the given object.
+    """
+    try:
+        return stripes[hash((id(obj), key)) % len(stripes)]
+    except TypeError:
+        # Unhashable keys, such as slices, lock the whole object.
+        return stripes[id(obj) % len(stripes)]
@@ -0,0 +1,93 @@
+from omp.core.openmp import Directive, OpenMP
+from omp.core.threading import CancelledRegion
+from omp.directives.for_construct import CancelledLoop
+import omp
+
+import ast
+import threading
+
+
+@OpenMP.directive('cancel')
+class CancelDirective(Directive):
+
+    """
+    OpenMP cancel directive implementation.
+    """
+
+    # The type of the cancelled construct, given by its clause: parallel, for or sections.
+    construct = None
+
+    def parse(self, node: ast.With) -> ast.With:
+        return node
+
+    def run(self):
+        cancel(self.construct)
+
+
+@OpenMP.directive('cancellation point')
+class CancellationPointDirective(Directive):
+
+    """
+    OpenMP cancellation point directive implementation.
+    """
+
+    construct = None
+
+    def parse(self, node: ast.With) -> ast.With:
+        return node
+
+    def run(self):
+        cancellation_point(self.construct)
+
+
+def innermost_loop(construct):
+    """
+    Return the state of the innermost loop run by the current thread, which sections constructs are made of.
+    """
+    loop = getattr(threading.current_thread(), 'loop', None)
+    if loop is None:
+        raise RuntimeError(f'A cancel {construct} directive must be nested in a {construct} construct.')
+    return loop
+
+
+def cancel(construct):
+    """
+    Cancel the innermost construct of the given type, and leave it. The other threads of the team leave it at their
+    next cancellation point: barriers and cancellation point directives for parallel regions, and the claim of each
+    chunk of iterations for loops.
+
+    Nothing happens unless cancellation is enabled, or if the threads of the team cannot share the cancellation.
+    """
+    if construct is None:
+        raise SyntaxError('The cancel directive expects the type of the cancelled construct: parallel, for or '
+                          'sections.')
+
+    team = threading.current_thread().team
+    if not omp.get_cancellation() or not team.shares_memory:
+        return
+
+    if construct == 'parallel':
+        team.cancel()
+        raise CancelledRegion
+
+    innermost_loop(construct).cancelled = True
+    raise CancelledLoop
+
+
+def cancellation_point(construct):
+    """
+    Leave the innermost construct of the given type if it was cancelled.
+    """
+    if construct is None:
+        raise SyntaxError('The cancellation point directive expects the type of the checked construct: parallel, for '
+                          'or sections.')
+
+    team = threading.current_thread().team
+    if not omp.get_cancellation() or not team.shares_memory:
+        return
+
+    if construct == 'parallel':
+        if team.cancelled:
+            raise CancelledRegion
+    elif innermost_loop(construct).cancelled:
+        raise CancelledLoop
@@ -1,5 +1,6 @@
 from omp.core.openmp import Directive, OpenMP
 from omp.core.ast_tools import LinenoStripper
+from omp.core.threading import SpinLock
 import omp
 
 import random
@@ -11,9 +12,11 @@ import threading
 class CriticalConstruct(Directive):
 
     """
-    OpenMP parallel construct implementation.
+    OpenMP critical construct implementation.
     """
 
+    hint = ''
+
     @property
     def template(self):
         nonce = random.randint(0, 100000)
@@ -22,7 +25,7 @@ class CriticalConstruct(Directive):
 with _omp_internal.core.openmp.OpenMP():
     if False:
         pass # Replaced by shared variables declarations
-    @_omp_internal.directives.critical_construct.run_critical
+    @_omp_internal.directives.critical_construct.run_critical({self.arguments!r}, {self.hint!r})
     def _omp_internal_inner_func{nonce}():
         pass # Replaced by user code
     _omp_internal_inner_func{nonce}()
@@ -53,10 +56,48 @@ with _omp_internal.core.openmp.OpenMP():
         return ast_template.body[0]
 
 
-def run_critical(func):
-    def wrap_func(*args, **kwargs):
-        lock = threading.current_thread().team.lock
-        with lock:
-            func(*args, **kwargs)
+# The locks of the critical sections, by name. All the unnamed critical sections share the same lock.
+locks = {}
+locks_lock = threading.Lock()
+
+# The hints for which a spinning lock is used.
+spinning_hints = ('uncontended', 'speculative')
+
 
-    return wrap_func
+def get_lock(name: str, hint: str = ''):
+    """
+    Return the lock of the critical sections with the given name, creating it according to the hint if needed.
+    """
+    lock = locks.get(name)
+    if lock is None:
+        with locks_lock:
+            if name not in locks:
+                locks[name] = SpinLock() if hint in spinning_hints else threading.Lock()
+            lock = locks[name]
+    return lock
+
+
+def run_critical(name: str = '', hint: str = ''):
+    def decorator(func):
+        def wrap_func(*args, **kwargs):
+            team = threading.current_thread().team
+
+            # Only the team's lock is shared by the members of a team of processes.
+            lock = get_lock(name, hint) if team.shares_memory else team.lock
+
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('lock_acquire', name=name)
+                with lock:
+                    omp.core.tools.emit('lock_acquired', name=name)
+                    try:
+                        func(*args, **kwargs)
+                    finally:
+                        omp.core.tools.emit('lock_release', name=name)
+                return
+
+            with lock:
+                func(*args, **kwargs)
+
+        return wrap_func
+
+    return decorator
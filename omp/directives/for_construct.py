@@ -2,42 +2,642 @@ import omp
 from omp.core.openmp import Directive, OpenMP
 from omp.core.ast_tools import LinenoStripper
 from omp.core.primitives import Sched
+from omp.core.threading import CancelledRegion, Workshare, counter
 
 import ast
+import collections.abc
+import functools
 import random
-import time
 import threading
 import itertools
+import operator
+import queue
 
 
-def generator_static(it, nonce, chunk):
+def is_indexable(it):
     """
-    When called within a thread of a team, yields the iterations for the current thread.
+    Whether the iterations over `it` can be partitioned from its length, without walking it.
+    """
+    return isinstance(it, collections.abc.Sequence) or hasattr(it, '__array_interface__')
+
+
+def iterate(it, start, stop):
+    """
+    Returns an iterator over the elements of the indexable `it` at positions `start` to `stop`.
+    """
+    if isinstance(it, range):
+        return iter(it[start:stop])
+    if isinstance(it, Collapse):
+        return it.iterate(start, stop)
+    if isinstance(it, Numbered):
+        return zip(range(start, stop), iterate(it.iterable, start, stop))
+    return map(it.__getitem__, range(start, stop))
+
+
+def block(it, start, stop):
+    """
+    Returns the elements of the indexable `it` at positions `start` to `stop` as a whole.
+
+    Ranges give the slice of their values, so that the block can index arrays without copying them. Negative values
+    count from the end, as they do as indices, so the values of a block must not change sign.
+    Other sequences give their own slice.
+    """
+    if isinstance(it, range):
+        values = it[start:stop]
+        # The stop of a slice wraps around like its start: a block ending at the first position going down, or at the
+        # last position going up, runs to the end instead.
+        end = values.stop
+        if values and values[-1] == (0 if values.step < 0 else -1):
+            end = None
+        return slice(values.start, end, values.step if values.step != 1 else None)
+    return it[start:stop]
+
+
+class Numbered(collections.abc.Sequence):
+
+    """
+    The elements of an indexable iterable, paired with their positions, as `enumerate` does for other iterables.
+    """
+
+    def __init__(self, iterable):
+        self.iterable = iterable
+
+    def __len__(self):
+        return len(self.iterable)
+
+    def __getitem__(self, position):
+        return position, self.iterable[position]
+
+
+def numbered(it):
+    """
+    Returns the elements of `it` paired with their positions, partitionable by the schedules if `it` is indexable.
+    """
+    return Numbered(it) if is_indexable(it) else enumerate(it)
+
+
+class Collapse(collections.abc.Sequence):
+
+    """
+    The iteration space of perfectly nested loops, as a sequence of the tuples of their loop variables.
+
+    The positions in the fused space are mapped back to the positions in each loop arithmetically, so the schedules
+    partition it like any other sequence. The loops must be rectangular: their iterables are evaluated only once.
+    """
+
+    def __init__(self, *iterables):
+        # Iterables which cannot be indexed are walked once, as the inner loops would be walked several times anyway.
+        self.spaces = tuple(it if is_indexable(it) else tuple(it) for it in iterables)
+
+        # The number of positions of the fused space covered by one iteration of each loop.
+        self.strides = [1] * len(self.spaces)
+        for dim in range(len(self.spaces) - 1, 0, -1):
+            self.strides[dim - 1] = self.strides[dim] * len(self.spaces[dim])
+        self.length = self.strides[0] * len(self.spaces[0]) if self.spaces else 0
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return tuple(self.iterate(*position.indices(self.length)[:2]))
+        if position < 0:
+            position += self.length
+        if not 0 <= position < self.length:
+            raise IndexError('collapsed loop index out of range')
+
+        values = []
+        for space, stride in zip(self.spaces, self.strides):
+            index, position = divmod(position, stride)
+            values.append(space[index])
+        return tuple(values)
+
+    def iterate(self, start, stop, dim=0):
+        """
+        Returns an iterator over the tuples of the variables of the loops `dim` and deeper, at positions `start` to
+        `stop` of their fused space.
+
+        Only the partial iterations of the outer loop at both ends are split further: the whole iterations in between
+        are produced by itertools.product.
+        """
+        if start >= stop:
+            return iter(())
+
+        space = self.spaces[dim]
+        if dim == len(self.spaces) - 1:
+            return zip(iterate(space, start, stop))
+
+        stride = self.strides[dim]
+        first, head = divmod(start, stride)
+        last, tail = divmod(stop, stride)
+
+        if first == last:
+            return map((space[first],).__add__, self.iterate(head, tail, dim + 1))
+
+        parts = []
+        if head:
+            parts.append(map((space[first],).__add__, self.iterate(head, stride, dim + 1)))
+            first += 1
+        parts.append(itertools.product(iterate(space, first, last), *self.spaces[dim + 1:]))
+        if tail:
+            parts.append(map((space[last],).__add__, self.iterate(0, tail, dim + 1)))
+        return itertools.chain.from_iterable(parts)
+
+
+def static_ranges(length, rank, size, chunk):
+    """
+    Returns the (start, stop) position ranges assigned to the thread `rank` of a team of `size` threads.
+
+    Without a chunk size, the iteration space is split in contiguous blocks of near-equal length.
+    Otherwise, chunks of the given size are assigned to the threads in a round-robin fashion.
+    """
+    if chunk is None:
+        base, extra = divmod(length, size)
+        start = rank * base + min(rank, extra)
+        return ((start, start + base + (rank < extra)),)
+
+    return ((start, min(start + chunk, length)) for start in range(rank * chunk, length, size * chunk))
+
+
+# With cancellation enabled, the threads check whether their loop was cancelled after that many iterations at most.
+cancellation_step = 64
+
+
+class CancelledLoop(BaseException):
+
+    """
+    Raised in a thread of a cancelled loop by the cancel and cancellation point directives, to leave the loop.
+
+    It is caught right after the loop, so that the iterations already run still count in the reductions.
+    """
+
+
+def pieces(ranges, step):
+    """
+    Splits the given (start, stop) position ranges in ranges of at most `step` positions.
+    """
+    for start, stop in ranges:
+        for piece in range(start, stop, step):
+            yield piece, min(piece + step, stop)
+
+
+def until_cancelled(items, state: Workshare):
+    """
+    Yields the given chunks or iterations of a loop until the loop or its parallel region is cancelled.
+    """
+    team = state.team
+    for item in items:
+        if state.cancelled or team.cancelled:
+            return
+        yield item
+
+
+def cancellable(iterations, state: Workshare):
+    """
+    Yields the given iterations of a loop, recording the loop for the cancel directives of the current thread.
+    """
+    thread = threading.current_thread()
+    previous = getattr(thread, 'loop', None)
+    thread.loop = state
+    try:
+        yield from iterations
+    finally:
+        thread.loop = previous
+        state.leave()
+
+
+def generator_static(it, chunk, chunked=False, prefetch=None):
+    """
+    When called within a thread of a team, returns an iterator over the iterations for the current thread.
+
+    Overall, when all the threads of the team call this function, all the elements of the iterator are yielded.
+    In chunked mode, the iterator yields whole blocks of iterations instead: see `block`.
+    The iterations of each thread are fixed, so they are not prefetched.
+    """
+    thread = threading.current_thread()
+    icv = thread.icv
+    rank, size = icv.thread_num_var, icv.team_size_var
+    tracing = omp.core.tools.enabled
+
+    # Loops can only be cancelled by threads sharing their state.
+    state = thread.team.workshare(Workshare) if icv.cancel_var and thread.team.shares_memory else None
+
+    if is_indexable(it):
+        ranges = static_ranges(len(it), rank, size, chunk)
+        if state is not None:
+            ranges = until_cancelled(pieces(ranges, cancellation_step), state)
+        if tracing:
+            ranges = dispatched(ranges)
+        if chunked:
+            iterations = itertools.starmap(functools.partial(block, it), ranges)
+        else:
+            iterations = itertools.chain.from_iterable(itertools.starmap(functools.partial(iterate, it), ranges))
+
+    # Other iterables have to be walked entirely by every thread.
+    elif chunked:
+        # The blocks of iterators are tuples of their elements.
+        if chunk is None:
+            # The thread buffers the iterator to take its contiguous block, as with sequences.
+            items = tuple(it)
+            iterations = itertools.starmap(functools.partial(block, items), static_ranges(len(items), rank, size, None))
+        else:
+            groups = itertools.groupby(enumerate(it), lambda el: el[0] // chunk)
+            iterations = (tuple(el for i, el in group) for index, group in groups if index % size == rank)
+    elif chunk is None or chunk == 1:
+        iterations = itertools.islice(it, rank, None, size)
+    else:
+        iterations = (el for i, el in enumerate(it) if i // chunk % size == rank)
+
+    if state is not None:
+        if not is_indexable(it):
+            iterations = until_cancelled(iterations, state)
+        iterations = cancellable(iterations, state)
+
+    return traced_work(iterations) if tracing else iterations
+
+
+def dispatched(ranges):
+    """
+    Reports the given (start, stop) position ranges to the tools as they are handed out to the current thread.
+    """
+    for start, stop in ranges:
+        omp.core.tools.emit('dispatch', iterations=stop - start, start=start)
+        yield start, stop
+
+
+def traced_work(iterations):
+    """
+    Reports the beginning and the end of the given loop iterations to the tools.
+    """
+    omp.core.tools.emit('work_begin', kind='loop')
+    try:
+        yield from iterations
+    finally:
+        omp.core.tools.emit('work_end', kind='loop')
+
+
+def guided_ranges(length, size, chunk):
+    """
+    Returns the successive (start, stop) position ranges of a guided schedule.
+
+    Each chunk is proportional to the number of remaining iterations divided by the team size,
+    and no smaller than the given chunk size, except for the last one.
+    """
+    ranges = []
+    start = 0
+    while start < length:
+        stop = min(start + max(-(-(length - start) // size), chunk), length)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+class DynamicRanges(Workshare):
+
+    """
+    Hands out fixed-size chunks of an indexable iterable.
+
+    Chunks are claimed through a shared counter of start positions (see omp.core.threading.counter), which only
+    takes a lock without the GIL.
+    """
+
+    def __init__(self, team, index, length, chunk):
+        super().__init__(team, index)
+        self.length = length
+        self.chunk = chunk
+        self.starts = counter(0, chunk)
+
+    def ranges(self):
+        """
+        Yields the (start, stop) position ranges claimed by the current thread.
+        """
+        length, chunk = self.length, self.chunk
+        for start in self.starts:
+            if start >= length:
+                return
+            yield start, min(start + chunk, length)
+
+
+class GuidedRanges(Workshare):
+
+    """
+    Hands out the precomputed chunks of a guided schedule over an indexable iterable.
+    """
+
+    def __init__(self, team, index, length, chunk):
+        super().__init__(team, index)
+        self.chunks = guided_ranges(length, team.size, chunk)
+        self.counter = counter()
+
+    def ranges(self):
+        """
+        Yields the (start, stop) position ranges claimed by the current thread.
+        """
+        chunks = self.chunks
+        for i in self.counter:
+            if i >= len(chunks):
+                return
+            yield chunks[i]
+
+
+class IteratorChunks(Workshare):
+
+    """
+    Hands out chunks of elements pulled from an iterator, which can only be done under a lock.
 
-    Overall, when all the threads of the team call this generator, all the elements of the iterator are yielded.
+    For guided schedules, the number of remaining iterations is given by the iterator's length hint when it has one.
+    Otherwise, it is estimated to be the number of iterations consumed so far, so chunks grow until the iterator
+    runs out.
     """
-    for i, el in enumerate(it):
-        if i % omp.get_num_threads() == omp.get_thread_num():
-            yield el
+
+    def __init__(self, team, index, it, chunk, guided):
+        super().__init__(team, index)
+        self.iterator = iter(it)
+        self.chunk = chunk
+        self.guided = guided
+        self.consumed = 0
+        self.lock = threading.Lock()
+
+    def next_chunk(self):
+        with self.lock:
+            return self.pull()
+
+    def pull(self):
+        """
+        Pull the next chunk of elements from the iterator. Only one thread may pull at a time.
+        """
+        size = self.chunk
+        if self.guided:
+            remaining = operator.length_hint(self.iterator, -1)
+            if remaining < 0:
+                remaining = self.consumed
+            size = max(-(-remaining // self.team.size), size)
+        batch = tuple(itertools.islice(self.iterator, size))
+        self.consumed += len(batch)
+        return batch
+
+    def chunks(self):
+        """
+        Yields the chunks of elements claimed by the current thread.
+        """
+        while batch := self.next_chunk():
+            yield batch
 
 
 class EndOfQueue:
     pass
 
 
+class PrefetchedChunks(IteratorChunks):
+
+    """
+    Hands out chunks of elements pulled from an iterator by a producer thread of its own, ahead of the threads of the
+    team.
+
+    The producer fills a queue of at most `depth` chunks, so that pulling the elements, such as reading them from a
+    file, overlaps with running the iterations. Ends with `EndOfQueue`, which each thread puts back for the others.
+    The producer is the only thread pulling from the iterator, so it does so without the lock: the threads of the team
+    only wait for the queue.
+    """
+
+    def __init__(self, team, index, it, chunk, guided, depth):
+        super().__init__(team, index, it, chunk, guided)
+        # Without a depth, each thread of the team has a chunk ready.
+        self.queue = queue.Queue(depth or team.size)
+        # The exception raised by the iterator, raised again by the first thread reaching the end of the queue.
+        self.error = None
+        self.closed = False
+        # Started by the first thread claiming a chunk, as the states created by the other threads are discarded.
+        self.producer = None
+
+    def produce(self):
+        try:
+            while not self.closed and (batch := self.pull()):
+                self.queue.put(batch)
+        except BaseException as error:
+            self.error = error
+        if not self.closed:
+            self.queue.put(EndOfQueue)
+
+    def chunks(self):
+        """
+        Yields the chunks of elements claimed by the current thread.
+        """
+        with self.lock:
+            if self.producer is None:
+                self.producer = threading.Thread(target=self.produce, name='omp-prefetch', daemon=True)
+                self.producer.start()
+
+        while (batch := self.queue.get()) is not EndOfQueue:
+            yield batch
+
+        self.queue.put(EndOfQueue)
+        with self.lock:
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def leave(self):
+        if next(self.left) == self.team.size:
+            del self.team.workshares[self.index]
+            # The threads may have left before the end of the iterator, if the loop was cancelled or failed: the
+            # producer is unblocked and stops.
+            self.closed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+
+
+def generator_shared(it, chunk, indexed_cls, guided, chunked=False, prefetch=None):
+    """
+    When called within a thread of a team, yields the iterations claimed by the current thread from the chunks
+    handed out to the team. In chunked mode, each chunk is yielded as a whole block: see `block`.
+    With a prefetch depth, the chunks of iterables which cannot be indexed are pulled ahead by a producer thread: see
+    `PrefetchedChunks`.
+    """
+    thread = threading.current_thread()
+    team = thread.team
+
+    if not team.shares_memory:
+        # Team members cannot hand out chunks to each other, so the iterations are distributed statically.
+        yield from generator_static(it, chunk, chunked)
+        return
+
+    tracing = omp.core.tools.enabled
+    if tracing:
+        omp.core.tools.emit('work_begin', kind='loop')
+
+    # The threads check whether the loop was cancelled before claiming each chunk, and within large chunks.
+    cancel = thread.icv.cancel_var
+    if cancel:
+        previous = getattr(thread, 'loop', None)
+
+    if is_indexable(it):
+        state = team.workshare(indexed_cls, len(it), chunk or 1)
+        ranges = state.ranges()
+        if cancel:
+            thread.loop = state
+            ranges = until_cancelled(pieces(ranges, cancellation_step), state)
+        if tracing:
+            ranges = dispatched(ranges)
+        try:
+            if chunked:
+                for start, stop in ranges:
+                    yield block(it, start, stop)
+            else:
+                for start, stop in ranges:
+                    yield from iterate(it, start, stop)
+        finally:
+            state.leave()
+            if cancel:
+                thread.loop = previous
+            if tracing:
+                omp.core.tools.emit('work_end', kind='loop')
+        return
+
+    if prefetch is None:
+        state = team.workshare(IteratorChunks, it, chunk or 1, guided)
+    else:
+        state = team.workshare(PrefetchedChunks, it, chunk or 1, guided, prefetch)
+    chunks = state.chunks()
+    if cancel:
+        thread.loop = state
+        chunks = until_cancelled(chunks, state)
+    try:
+        for batch in chunks:
+            if tracing:
+                omp.core.tools.emit('dispatch', iterations=len(batch))
+            if chunked:
+                yield batch
+            else:
+                yield from batch
+    finally:
+        state.leave()
+        if cancel:
+            thread.loop = previous
+        if tracing:
+            omp.core.tools.emit('work_end', kind='loop')
+
+
+def generator_dynamic(it, chunk, chunked=False, prefetch=None):
+    """
+    Iterations of a dynamic schedule: chunks of a fixed size are handed out to the threads as they request them.
+    """
+    return generator_shared(it, chunk, DynamicRanges, False, chunked, prefetch)
+
+
+def generator_guided(it, chunk, chunked=False, prefetch=None):
+    """
+    Iterations of a guided schedule: chunks of shrinking size are handed out to the threads as they request them.
+    """
+    return generator_shared(it, chunk, GuidedRanges, True, chunked, prefetch)
+
+
+generator_auto = generator_guided
+
+
+class OrderedTickets(Workshare):
+
+    """
+    The state of a loop with an ordered clause: the iterations take turns, in the order of the loop, to run their
+    ordered block.
+
+    The iterations wait for their turn on the task condition of the team, which is notified when the team is aborted
+    or cancelled: their predecessor may then never pass its turn.
+    """
+
+    def __init__(self, team, index):
+        super().__init__(team, index)
+        # The position of the iteration whose turn it is.
+        self.next = 0
+
+    def wait(self, position):
+        """
+        Wait for the turn of the iteration at the given position.
+        """
+        if self.next == position:
+            return
+
+        team = self.team
+        with team.tasks_condition:
+            while self.next != position:
+                if team.barrier.broken:
+                    raise threading.BrokenBarrierError
+                if team.cancelled:
+                    raise CancelledRegion
+                team.tasks_condition.wait()
+
+    def advance(self, position):
+        """
+        Pass the turn of the iteration at the given position to its successor.
+        """
+        with self.team.tasks_condition:
+            self.next = position + 1
+            self.team.tasks_condition.notify_all()
+
+
+def ordered_iterations(iterations):
+    """
+    Yields the values of the given numbered iterations of a loop with an ordered clause, recording the position of the
+    current iteration for its ordered block.
+
+    Iterations which do not run an ordered block still wait for their turn to pass it, once their body is done.
+    """
+    thread = threading.current_thread()
+    team = thread.team
+    if not team.shares_memory:
+        raise RuntimeError('The ordered clause requires the thread backend, whose threads can wait for each other.')
+
+    tickets = team.workshare(OrderedTickets)
+    previous = getattr(thread, 'ordered', None)
+    try:
+        for position, value in iterations:
+            thread.ordered = (tickets, position)
+            yield value
+            # The ordered block clears the current iteration once it passed its turn.
+            if thread.ordered is not None:
+                tickets.wait(position)
+                tickets.advance(position)
+    finally:
+        thread.ordered = previous
+        tickets.leave()
+
+
 @OpenMP.directive('for')
 class ForConstruct(Directive):
 
-    schedule = (Sched.runtime, 1)
+    schedule = (Sched.runtime, None)
+    collapse = 1
+    chunked = False
+    ordered = False
+    # The number of chunks pulled ahead from the iterable by a producer thread, 0 for the team size, or None.
+    prefetch = None
 
     """
     OpenMP for construct implementation.
     """
 
+    def collapse_loops(self, for_node: ast.For) -> ast.For:
+        """
+        Fuse the given loop and the loops perfectly nested in it, according to the collapse clause, into a loop over
+        their collapsed iteration space.
+        """
+        loops = [for_node]
+        for _ in range(self.collapse - 1):
+            body = loops[-1].body
+            if len(body) != 1 or not isinstance(body[0], ast.For) or loops[-1].orelse:
+                raise SyntaxError(f'A for construct with a collapse({self.collapse}) clause must be followed by '
+                                  f'{self.collapse} perfectly nested loops.')
+            loops.append(body[0])
+
+        collapse = LinenoStripper().visit(ast.parse('_omp_internal.directives.for_construct.Collapse')).body[0].value
+        return ast.For(target=ast.Tuple(elts=[loop.target for loop in loops], ctx=ast.Store()),
+                       iter=ast.Call(collapse, args=[loop.iter for loop in loops], keywords=[]),
+                       body=loops[-1].body, orelse=loops[-1].orelse, type_comment=None)
+
     @property
     def template(self):
 
-        reduction_vars, reduction_operators = list(zip(*self.reduction.items())) if self.reduction else ([], [])
+        reduction_vars, reduction_operators = tuple(zip(*self.reduction.items())) if self.reduction else ((), ())
         nonce = random.randint(0, 100000)
 
         return f"""\
@@ -45,62 +645,50 @@ with _omp_internal.core.openmp.OpenMP():
     if False:
         pass # Replaced by shared variables declarations
     def _omp_internal_inner_func{nonce}({','.join(reduction_vars)}):
-        pass # Replaced by user code
-        {'#' if self.nowait else ''}_omp_internal.core.openmp.OpenMP("barrier")
+        try:
+            pass # Replaced by user code
+        except _omp_internal.directives.for_construct.CancelledLoop:
+            pass
         {'' if reduction_vars else '#'}return ({','.join(reduction_vars)},)
     def _omp_internal_inner_func_protect{nonce}():
         {'' if reduction_vars else '#'}nonlocal {','.join(reduction_vars)}
-        _omp_internal_retval = _omp_internal_inner_func{nonce}({','.join(reduction_vars)})
-        {'' if reduction_vars else '#'}with _omp_internal.core.openmp.OpenMP('critical'):
-            {'' if reduction_vars else '#'}({','.join(reduction_vars)},) = [_omp_internal.clauses.reduction.operators[_omp_internal_operator](_omp_internal_var, _omp_internal_val) for _omp_internal_operator, _omp_internal_var, _omp_internal_val in zip({reduction_operators}, ({','.join(reduction_vars)},), _omp_internal_retval)]
+        _omp_internal_retval = _omp_internal_inner_func{nonce}(*_omp_internal.clauses.reduction.initial_values({reduction_operators}))
+        {'' if reduction_vars else '#'}_omp_internal_retval = _omp_internal.clauses.reduction.combine({reduction_operators}, {reduction_vars}, ({','.join(reduction_vars)},), _omp_internal_retval)
+        {'' if reduction_vars else '#'}if _omp_internal_retval is not None:
+            {'' if reduction_vars else '#'}({','.join(reduction_vars)},) = _omp_internal_retval
+        {'#' if self.nowait else ''}_omp_internal.core.openmp.OpenMP("barrier")
     _omp_internal_inner_func_protect{nonce}()
     """
 
-    @staticmethod
-    def define_generators():
-
-        if hasattr(omp.directives.for_construct, 'dynamic'):
-            return
-
-        @omp.enable
-        def generator_dynamic(it, nonce, chunk):
-            thread = threading.current_thread()
-            with OpenMP("single"):
-                thread.team.globalvars[f'_omp_interal_for_batched_it{nonce}'] = iter(itertools.batched(it, chunk)), threading.Lock()
-            batched_it, lock = thread.team.globalvars[f'_omp_interal_for_batched_it{nonce}']
-            while True:
-                try:
-                    with lock:
-                        el = next(batched_it)
-                except StopIteration:
-                    break
-                else:
-                    yield from el
-            OpenMP("barrier")
-            with OpenMP("single nowait"):
-                del thread.team.globalvars[f'_omp_interal_for_batched_it{nonce}']
-
-        omp.directives.for_construct.generator_dynamic = generator_dynamic
-        omp.directives.for_construct.generator_guided = omp.directives.for_construct.generator_dynamic
-        omp.directives.for_construct.generator_auto = omp.directives.for_construct.generator_dynamic
-
     def parse(self, node: ast.With):
 
-        self.define_generators()
-
         for_node: ast.For = node.body[0]
 
+        if self.collapse > 1:
+            for_node = node.body[0] = self.collapse_loops(for_node)
+
         schedule = self.schedule
 
         if schedule[0] == Sched.runtime:
             schedule = omp.get_schedule()
 
+        # Ordered loops iterate over the positions of the iterations along with their values.
+        if self.ordered:
+            if self.chunked:
+                raise SyntaxError('A for construct cannot have both an ordered and a chunked clause.')
+            for_node.iter = ast.Call(LinenoStripper().visit(ast.parse('_omp_internal.directives.for_construct.numbered')).body[0].value, args=[for_node.iter], keywords=[])
+
         # Wrap the loop iterator in our thread-distributing generator.
-        for_node.iter = ast.Call(LinenoStripper().visit(ast.parse(f'_omp_internal.directives.for_construct.generator_{schedule[0].name}')).body[0].value, args=[for_node.iter, ast.Constant(value=time.time()), ast.Constant(value=schedule[1])], keywords=[])
+        # In chunked mode, the target receives whole blocks of iterations instead of single iterations.
+        for_node.iter = ast.Call(LinenoStripper().visit(ast.parse(f'_omp_internal.directives.for_construct.generator_{schedule[0].name}')).body[0].value, args=[for_node.iter, ast.Constant(value=schedule[1]), ast.Constant(value=self.chunked)], keywords=[])
+        if self.prefetch is not None:
+            for_node.iter.keywords.append(ast.keyword(arg='prefetch', value=ast.Constant(value=self.prefetch)))
+
+        if self.ordered:
+            for_node.iter = ast.Call(LinenoStripper().visit(ast.parse('_omp_internal.directives.for_construct.ordered_iterations')).body[0].value, args=[for_node.iter], keywords=[])
 
-        # We need to protect the target.
-        # ALERT: We need to handle unpacking as well. (`for i,j in it`)
-        target = for_node.target.id
+        # We need to protect the target, which can unpack the iterations. (`for i,j in it`)
+        targets = [name.id for name in ast.walk(for_node.target) if isinstance(name, ast.Name)]
 
         # Parse the template to AST.
         ast_template = LinenoStripper().visit(ast.parse(self.template, mode='exec'))
@@ -112,7 +700,7 @@ with _omp_internal.core.openmp.OpenMP():
         inner_func: ast.FunctionDef = ast_template.body[0].body[1]
 
         # Variables are shared except for target
-        shared = [name for name in self.list_locals(for_node.body) if name != target]
+        shared = [name for name in self.list_locals(for_node.body) if name not in targets]
 
         # Replace the pass statement in the if body.
         if_stmt.body = self.replace(if_stmt.body, self.assign_shared(shared + list(self.reduction.keys())))
@@ -120,7 +708,9 @@ with _omp_internal.core.openmp.OpenMP():
         # Replace the pass statement in the inner function body.
         nonlocals = []
         if len(shared) > 0:
-            nonlocals = [ast.Nonlocal(names=[name for name in shared if name != target])]
+            nonlocals = [ast.Nonlocal(names=shared)]
 
-        inner_func.body = self.replace(inner_func.body, nonlocals + node.body)
+        # The loop is run in a try statement, which a cancelled loop leaves.
+        try_stmt: ast.Try = inner_func.body[0]
+        try_stmt.body = self.replace(try_stmt.body, nonlocals + node.body)
         return ast_template.body[0]
@@ -0,0 +1,45 @@
+from omp.core.openmp import Directive, OpenMP
+from omp.core.ast_tools import LinenoStripper
+
+import ast
+import contextlib
+import threading
+
+
+@OpenMP.directive('ordered')
+class OrderedConstruct(Directive):
+
+    """
+    OpenMP ordered construct implementation.
+
+    The body is not outlined: it runs in place, in a with statement waiting for the turn of the current iteration of
+    the enclosing loop with an ordered clause.
+    """
+
+    def parse(self, node: ast.With) -> ast.With:
+        with_stmt: ast.With = LinenoStripper().visit(ast.parse(
+            'with _omp_internal.directives.ordered_construct.ordered():\n    pass', mode='exec')).body[0]
+        with_stmt.body = node.body
+        return with_stmt
+
+
+@contextlib.contextmanager
+def ordered():
+    """
+    Context manager running its body in the order of the iterations of the enclosing loop with an ordered clause.
+
+    Outside of such a loop, the body runs right away.
+    """
+    thread = threading.current_thread()
+    current = getattr(thread, 'ordered', None)
+    if current is None:
+        yield
+        return
+
+    tickets, position = current
+    tickets.wait(position)
+    try:
+        yield
+    finally:
+        thread.ordered = None
+        tickets.advance(position)
@@ -1,9 +1,13 @@
 from omp.core.openmp import Directive, OpenMP
 from omp.core.threading import Team
 from omp.core.ast_tools import LinenoStripper
+import omp
 
 import ast
+import asyncio
+import copy
 import random
+import threading
 
 
 @OpenMP.directive('parallel')
@@ -13,6 +17,11 @@ class ParallelConstruct(Directive):
     OpenMP parallel construct implementation.
     """
 
+    # The policy of the proc_bind clause. By default, the policy is given by the bind-var ICV.
+    proc_bind = ''
+    # Whether the construct is awaited by a coroutine, as in `async with OpenMP("parallel")`.
+    asynchronous = False
+
     @property
     def template(self):
         nonce = random.randint(0, 100000)
@@ -20,10 +29,10 @@ class ParallelConstruct(Directive):
 with _omp_internal.core.openmp.OpenMP():
     if False:
         pass # Replaced by shared variables declarations
-    @_omp_internal.directives.parallel_construct.run_parallel
+    @_omp_internal.directives.parallel_construct.run_parallel({self.proc_bind!r}, {self.asynchronous!r})
     def _omp_internal_inner_func{nonce}():
         pass # Replaced by user code
-    _omp_internal_inner_func{nonce}()
+    {"await " if self.asynchronous else ""}_omp_internal_inner_func{nonce}()
         """
 
     def parse(self, node: ast.With) -> ast.With:
@@ -51,15 +60,181 @@ with _omp_internal.core.openmp.OpenMP():
         return ast_template.body[0]
 
 
-def run_parallel(func):
+def run_parallel(proc_bind: str = '', asynchronous: bool = False):
     """
-    When the new function is called, creates a team of threads that will each run the given function concurrently.
+    When the new function is called, runs the given function concurrently on each thread of a team.
+    The persistent hot team is used whenever it is available, otherwise a new team is created.
+    With the process backend, the team is made of forked processes instead, and with the interpreter backend, of
+    subinterpreters.
+    Regions nested deeper than the maximum number of active levels, or exceeding the thread limit, are run by smaller
+    teams, down to the encountering thread alone.
+    The threads of the team are bound to places according to the given policy, or else the bind-var ICV.
+    If asynchronous, the new function is a coroutine function, which returns once the team completed the region without
+    blocking the event loop meanwhile.
     Decorates the given function.
     """
 
-    def wrapped(*args, **kwargs):
-        team = Team(size=None, target=func, args=args, kwargs=kwargs)
-
-        team.start()
-        team.join()
-    return wrapped
+    def decorator(func):
+        def region(places, *args, **kwargs):
+            thread = threading.current_thread()
+            if places is not None:
+                thread.icv.place_num_var, thread.icv.place_partition_var = places[thread.rank]
+                omp.core.affinity.bind(thread.icv.place_num_var)
+            else:
+                thread.icv.place_num_var = -1
+                if getattr(thread, 'bound_place', None) is not None:
+                    omp.core.affinity.bind(None)
+
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('implicit_task_begin', thread_num=thread.rank)
+
+            try:
+                func(*args, **kwargs)
+            except omp.core.threading.CancelledRegion:
+                pass
+            # The threads leave the region once all the tasks of the team are completed.
+            thread.team.complete_tasks()
+
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('implicit_task_end', thread_num=thread.rank)
+
+        def wrapped(*args, **kwargs):
+            if omp.get_backend() == 'process':
+                omp.core.processes.run(omp.get_max_threads(), func, args, kwargs)
+                return
+
+            # Regions referring to objects other interpreters cannot rebuild are run by threads instead.
+            if omp.get_backend() == 'interpreter' and omp.core.interpreters.run(omp.get_max_threads(), func, args,
+                                                                                 kwargs):
+                return
+
+            icv = threading.current_thread().icv
+            size = omp.get_max_threads() if icv.active_levels_var < icv.max_active_levels_var else 1
+
+            # The encountering thread waits for the team, so it lends its place in the thread budget to the team.
+            budget = omp.core.threading.thread_budget
+            extra = budget.acquire(size - 1, icv.thread_limit_var)
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('parallel_begin', size=extra + 1)
+            try:
+                if extra == 0:
+                    # The encountering thread keeps its own place.
+                    if omp.core.tools.enabled:
+                        omp.core.tools.emit('implicit_task_begin', thread_num=0)
+                    omp.core.threading.run_serialized(func, args, kwargs)
+                    if omp.core.tools.enabled:
+                        omp.core.tools.emit('implicit_task_end', thread_num=0)
+                    return
+
+                places = omp.core.affinity.assign(proc_bind or icv.bind_var[0], icv.place_num_var,
+                                                  icv.place_partition_var, extra + 1)
+
+                hot_team = omp.core.threading.hot_team
+
+                # The hot team runs one region at a time.
+                # Nested regions, and regions entered concurrently from other threads, get a team of their own.
+                if hot_team.busy.acquire(blocking=False):
+                    try:
+                        hot_team.run(extra + 1, region, (places, *args), kwargs)
+                    finally:
+                        hot_team.busy.release()
+                    return
+
+                team = Team(size=extra + 1, target=region, args=(places, *args), kwargs=kwargs)
+
+                team.start()
+                team.join()
+            finally:
+                budget.release(extra)
+                if omp.core.tools.enabled:
+                    omp.core.tools.emit('parallel_end', size=extra + 1)
+
+        def start(on_done, args, kwargs):
+            """
+            Start the region on the hot team, and call `on_done` once it is completed. Return the size of the team, or
+            0 if the region cannot be run by the hot team.
+            """
+            if omp.get_backend() != 'thread':
+                return 0
+
+            icv = threading.current_thread().icv
+            size = omp.get_max_threads() if icv.active_levels_var < icv.max_active_levels_var else 1
+            hot_team = omp.core.threading.hot_team
+            if size == 1 or not hot_team.busy.acquire(blocking=False):
+                return 0
+
+            # The encountering thread keeps running the event loop, but it lends its place to the team like in a
+            # synchronous region.
+            budget = omp.core.threading.thread_budget
+            extra = budget.acquire(size - 1, icv.thread_limit_var)
+
+            def finish():
+                budget.release(extra)
+                hot_team.busy.release()
+                on_done()
+
+            if extra == 0:
+                hot_team.busy.release()
+                return 0
+
+            try:
+                places = omp.core.affinity.assign(proc_bind or icv.bind_var[0], icv.place_num_var,
+                                                  icv.place_partition_var, extra + 1)
+                if omp.core.tools.enabled:
+                    omp.core.tools.emit('parallel_begin', size=extra + 1)
+                hot_team.start(extra + 1, region, (places, *args), kwargs, on_done=finish)
+            except BaseException:
+                budget.release(extra)
+                hot_team.busy.release()
+                raise
+            return extra + 1
+
+        async def awaitable(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+
+            def resolve(error):
+                # The awaiting task may have been cancelled meanwhile.
+                if not future.done():
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+
+            def done(error=None):
+                try:
+                    loop.call_soon_threadsafe(resolve, error)
+                except RuntimeError:
+                    # The event loop was closed meanwhile.
+                    pass
+
+            size = start(done, args, kwargs)
+            if size:
+                try:
+                    await future
+                finally:
+                    if omp.core.tools.enabled:
+                        omp.core.tools.emit('parallel_end', size=size)
+                return
+
+            # Otherwise, a thread standing for the encountering thread runs the region as a synchronous one.
+            def encounter():
+                try:
+                    wrapped(*args, **kwargs)
+                except Exception as error:
+                    done(error)
+                else:
+                    done()
+
+            caller = threading.current_thread()
+            stand_in = omp.core.threading.Thread(caller.rank, caller.team, target=encounter, name='omp-encountering',
+                                                 daemon=True)
+            # The thread is not a child of the encountering thread, but the encountering thread itself: it takes its
+            # ICVs as they are, at the same nesting level.
+            stand_in.icv = copy.copy(caller.icv)
+            stand_in.start()
+            await future
+
+        return awaitable if asynchronous else wrapped
+
+    return decorator
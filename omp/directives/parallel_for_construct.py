@@ -11,10 +11,13 @@ class ParallelForConstruct(Directive):
     OpenMP parallel construct implementation.
     """
 
+    # Whether the construct is awaited by a coroutine, as in `async with OpenMP("parallel for")`.
+    asynchronous = False
+
     @property
     def template(self):
         return f"""\
-with _omp_internal.core.openmp.OpenMP("parallel {self.openMP.clause_str}"):
+{"async " if self.asynchronous else ""}with _omp_internal.core.openmp.OpenMP("parallel {self.openMP.clause_str}"):
     with _omp_internal.core.openmp.OpenMP("for {self.openMP.clause_str}"):
         pass # Replaced by user code
         """
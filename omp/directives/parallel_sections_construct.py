@@ -0,0 +1,34 @@
+from omp.core.openmp import Directive, OpenMP
+from omp.core.ast_tools import LinenoStripper
+
+import ast
+
+
+@OpenMP.directive('parallel sections')
+class ParallelSectionsConstruct(Directive):
+
+    """
+    OpenMP parallel sections construct implementation.
+    """
+
+    # Whether the construct is awaited by a coroutine, as in `async with OpenMP("parallel sections")`.
+    asynchronous = False
+
+    @property
+    def template(self):
+        return f"""\
+{"async " if self.asynchronous else ""}with _omp_internal.core.openmp.OpenMP("parallel {self.openMP.clause_str}"):
+    with _omp_internal.core.openmp.OpenMP("sections {self.openMP.clause_str}"):
+        pass # Replaced by user code
+        """
+
+    def parse(self, node: ast.With) -> ast.With:
+        # Parse the template to AST.
+        ast_template = LinenoStripper().visit(ast.parse(self.template, mode='exec'))
+
+        # Extract the inner with statement.
+        with_stmt: ast.With = ast_template.body[0].body[0]
+
+        # Replace the pass statement in the inner with body.
+        with_stmt.body = self.replace(with_stmt.body, node.body)
+        return ast_template.body[0]
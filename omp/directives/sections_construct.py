@@ -0,0 +1,86 @@
+from omp.core.openmp import Directive, OpenMP
+from omp.core.ast_tools import LinenoStripper
+
+import ast
+import random
+
+
+@OpenMP.directive('sections')
+class SectionsConstruct(Directive):
+
+    """
+    OpenMP sections construct implementation.
+
+    The construct is rewritten into a `for` construct over the indices of its sections, with a dynamic schedule so that
+    each section is run by the next available thread. The loop body selects the section to run.
+    """
+
+    @property
+    def template(self):
+        return f"""\
+with _omp_internal.core.openmp.OpenMP("for schedule(dynamic, 1) {self.openMP.clause_str}"):
+    for _omp_internal_section{self.nonce} in range({len(self.sections)}):
+        pass # Replaced by the sections
+        """
+
+    @staticmethod
+    def is_section(statement: ast.AST):
+        """
+        Whether the given statement is a section construct.
+        """
+        if not isinstance(statement, ast.With) or len(statement.items) != 1:
+            return False
+
+        call = statement.items[0].context_expr
+        return (isinstance(call, ast.Call) and len(call.args) == 1 and isinstance(call.args[0], ast.Constant)
+                and call.args[0].value.strip() == 'section')
+
+    def split_sections(self, body: list[ast.AST]) -> list[list[ast.AST]]:
+        """
+        Return the bodies of the sections in the given sections body.
+
+        The statements before the first section construct make up the first section.
+        """
+        sections = []
+        for statement in body:
+            if self.is_section(statement):
+                sections.append(statement.body)
+            elif not sections:
+                sections.append([statement])
+            elif len(sections) == 1 and not self.is_section(body[0]):
+                sections[0].append(statement)
+            else:
+                raise SyntaxError('Only section constructs can follow the first section of a sections construct.')
+        return sections
+
+    def parse(self, node: ast.With) -> ast.With:
+        self.sections = self.split_sections(node.body)
+        self.nonce = random.randint(0, 100000)
+
+        # Parse the template to AST.
+        ast_template = LinenoStripper().visit(ast.parse(self.template, mode='exec'))
+
+        # Extract the for statement.
+        for_stmt: ast.For = ast_template.body[0].body[0]
+
+        # Chain the sections in an if statement on the loop index.
+        dispatch = []
+        for index, section in reversed(list(enumerate(self.sections))):
+            test = LinenoStripper().visit(ast.parse(f'_omp_internal_section{self.nonce} == {index}', mode='eval').body)
+            dispatch = [ast.If(test=test, body=section, orelse=dispatch)]
+
+        for_stmt.body = self.replace(for_stmt.body, dispatch)
+        return ast_template.body[0]
+
+
+@OpenMP.directive('section')
+class SectionConstruct(Directive):
+
+    """
+    OpenMP section construct implementation.
+
+    Sections are handled by the enclosing sections construct.
+    """
+
+    def parse(self, node: ast.With) -> ast.With:
+        return node
@@ -1,5 +1,7 @@
 from omp.core.openmp import Directive, OpenMP
 from omp.core.ast_tools import LinenoStripper
+from omp.core.threading import Workshare, counter
+import omp
 
 import ast
 import threading
@@ -52,20 +54,38 @@ with _omp_internal.core.openmp.OpenMP():
         return ast_template.body[0]
 
 
-def run_single(func):
-    def wrap_func(nowait):
+class SingleClaim(Workshare):
+
+    """
+    The state of a single construct: the first thread to take a ticket runs the construct.
+    """
+
+    def __init__(self, team, index):
+        super().__init__(team, index)
+        self.tickets = counter()
 
-        with threading.current_thread().team.lock:
-            if threading.current_thread().team.singleThread is None:
-                threading.current_thread().team.singleThread = threading.current_thread()
 
-        if threading.current_thread().team.singleThread is threading.current_thread():
+def run_single(func):
+    def wrap_func(nowait):
+        thread = threading.current_thread()
+        team = thread.team
+
+        if not team.shares_memory:
+            # Team members cannot agree on who comes first, so the first one is elected.
+            elected = thread.rank == 0
+        else:
+            state = team.workshare(SingleClaim)
+            elected = next(state.tickets) == 0
+            state.leave()
+
+        if elected:
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('work_begin', kind='single')
             func()
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('work_end', kind='single')
 
         if not nowait:
-            threading.current_thread().team.barrier.wait()
-            if threading.current_thread().team.singleThread is threading.current_thread():
-                threading.current_thread().team.singleThread = None
-            threading.current_thread().team.barrier.wait()
+            team.barrier.wait()
 
     return wrap_func
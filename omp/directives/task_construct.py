@@ -0,0 +1,174 @@
+from omp.core.openmp import Directive, OpenMP
+from omp.core.ast_tools import LinenoStripper
+from omp.core.threading import Task, TaskGroup
+import omp
+
+import ast
+import contextlib
+import random
+import threading
+
+
+@OpenMP.directive('task')
+class TaskConstruct(Directive):
+
+    """
+    OpenMP task construct implementation.
+
+    The variables assigned by the task are shared with the enclosing function, while the local variables of the
+    enclosing function it only reads are firstprivate: their values are captured when the task is created.
+    """
+
+    # The expressions of the `if` and `final` clauses.
+    if_ = 'True'
+    final = 'False'
+
+    @property
+    def template(self):
+        nonce = random.randint(0, 100000)
+
+        return f"""\
+with _omp_internal.core.openmp.OpenMP():
+    if False:
+        pass # Replaced by shared variables declarations
+    def _omp_internal_inner_func{nonce}():
+        pass # Replaced by user code
+    _omp_internal.directives.task_construct.spawn(_omp_internal_inner_func{nonce}, {self.if_}, {self.final})
+        """
+
+    def list_firstprivates(self, body: list[ast.AST], shared: list[str]) -> list[str]:
+        """
+        Return the local variables of the enclosing function read by the given task body, which are not shared.
+        """
+        firstprivates = {}
+        for statement in body:
+            for node in ast.walk(statement):
+                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                    firstprivates[node.id] = None
+
+        return [varname for varname in firstprivates
+                if varname in self.enclosing_locals and varname not in shared and varname not in self.privates
+                and not varname.startswith('_omp_internal')]
+
+    def parse(self, node: ast.With) -> ast.With:
+        # Parse the template to AST.
+        ast_template = LinenoStripper().visit(ast.parse(self.template, mode='exec'))
+
+        # Extract the if statement.
+        if_stmt: ast.If = ast_template.body[0].body[0]
+
+        # Extract the inner function definition.
+        inner_func: ast.FunctionDef = ast_template.body[0].body[1]
+
+        shared = self.list_locals(node.body)
+
+        # Replace the pass statement in the if body.
+        if_stmt.body = self.replace(if_stmt.body, self.assign_shared(shared))
+
+        # The firstprivate variables are captured by the default values of the parameters of the inner function.
+        firstprivates = self.list_firstprivates(node.body, shared)
+        inner_func.args.args = [ast.arg(arg=name) for name in firstprivates]
+        inner_func.args.defaults = [ast.Name(id=name, ctx=ast.Load()) for name in firstprivates]
+
+        # List the shared variables
+        nonlocals = []
+        if len(shared) > 0:
+            nonlocals = [ast.Nonlocal(names=list(shared))]
+
+        # Replace the pass statement in the inner function body.
+        inner_func.body = self.replace(inner_func.body, nonlocals + node.body)
+        return ast_template.body[0]
+
+
+@OpenMP.directive('taskwait')
+class TaskwaitDirective(Directive):
+
+    """
+    OpenMP taskwait directive implementation.
+    """
+
+    def parse(self, node: ast.With) -> ast.With:
+        return node
+
+    def run(self):
+        taskwait()
+
+
+@OpenMP.directive('taskgroup')
+class TaskgroupConstruct(Directive):
+
+    """
+    OpenMP taskgroup construct implementation.
+
+    The body is not outlined: it runs in place, in a with statement waiting for the tasks of the group.
+    """
+
+    def parse(self, node: ast.With) -> ast.With:
+        with_stmt: ast.With = LinenoStripper().visit(ast.parse(
+            'with _omp_internal.directives.task_construct.taskgroup():\n    pass', mode='exec')).body[0]
+        with_stmt.body = node.body
+        return with_stmt
+
+
+# Tasks are run immediately instead of being queued once the deque of their creating thread holds that many tasks.
+max_queued = 64
+
+
+def spawn(func, if_=True, final=False):
+    """
+    Create a task running the given function.
+
+    The task is queued, unless it is undeferred by its `if` clause, included in a final task, or the team is unable to
+    share it, in which case it runs immediately.
+    """
+    thread = threading.current_thread()
+    team = thread.team
+    parent: Task = thread.task
+
+    task = Task(func, parent, final or parent.final)
+
+    if (if_ and not parent.final and team.shares_memory and team.size > 1
+            and len(team.deques[thread.rank]) < max_queued):
+        team.spawn(task)
+        return
+
+    thread.task = task
+    try:
+        func()
+    finally:
+        thread.task = parent
+
+
+def taskwait():
+    """
+    Wait for the child tasks of the current task to complete, running queued tasks meanwhile.
+    """
+    thread = threading.current_thread()
+    task: Task = thread.task
+    if task.children:
+        if omp.core.tools.enabled:
+            omp.core.tools.emit('sync_wait_begin', kind='taskwait')
+        thread.team.help_until(lambda: task.children == 0)
+        if omp.core.tools.enabled:
+            omp.core.tools.emit('sync_wait_end', kind='taskwait')
+
+
+@contextlib.contextmanager
+def taskgroup():
+    """
+    Context manager waiting, on exit, for the tasks created in its body and their descendant tasks.
+    """
+    task: Task = threading.current_thread().task
+    group = TaskGroup()
+    previous = task.taskgroup
+    task.taskgroup = group
+    try:
+        yield
+    finally:
+        task.taskgroup = previous
+        if group.pending:
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('sync_wait_begin', kind='taskgroup')
+            threading.current_thread().team.help_until(lambda: group.pending == 0)
+            if omp.core.tools.enabled:
+                omp.core.tools.emit('sync_wait_end', kind='taskgroup')
@@ -0,0 +1,18 @@
+import threading
+
+import omp
+
+
+def run_in_thread(function, timeout):
+    """
+    Run the given function in a daemon thread, and return whether it completed in time.
+    """
+    def initial():
+        # Like the main thread, the thread runs the implicit parallel region on its own.
+        threading.current_thread().team = omp.core.threading.SerialTeam()
+        function()
+
+    thread = omp.core.threading.Thread(0, omp.core.threading.SerialTeam(), target=initial, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
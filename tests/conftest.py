@@ -0,0 +1,4 @@
+import omp
+
+# The tests decorate functions many times: their transformed code must not be read from the cache.
+omp.core.cache.enabled = False
@@ -0,0 +1,54 @@
+import pytest
+
+from omp.core.affinity import assign, parse_places, parse_proc_bind
+
+
+@pytest.mark.parametrize('value, places', [
+    ('{0,1},{2,3}', [(0, 1), (2, 3)]),
+    ('{0:2}:2:2', [(0, 1), (2, 3)]),
+    ('{0:2:2}', [(0, 2)]),
+    ('{0},{4}:3:1', [(0,), (4,), (5,), (6,)]),
+])
+def test_explicit_places(value, places):
+    assert parse_places(value) == places
+
+
+def test_abstract_places_can_be_limited():
+    assert len(parse_places('threads(1)')) == 1
+
+
+@pytest.mark.parametrize('value', ['nodes', '{0:1:2:3}', '0,1'])
+def test_invalid_places(value):
+    with pytest.raises(ValueError):
+        parse_places(value)
+
+
+def test_proc_bind_policies():
+    assert parse_proc_bind('spread, master') == ('spread', 'primary')
+    with pytest.raises(ValueError):
+        parse_proc_bind('far')
+
+
+PARTITION = tuple(range(8))
+
+
+def test_unbound_teams_are_not_assigned_places():
+    assert assign('false', 0, PARTITION, 4) is None
+
+
+def test_primary_binds_the_team_to_the_place_of_the_parent():
+    assert assign('primary', 3, PARTITION, 2) == [(3, PARTITION)] * 2
+
+
+def test_close_binds_the_threads_to_consecutive_places():
+    assert assign('close', 6, PARTITION, 4) == [(6, PARTITION), (7, PARTITION), (0, PARTITION), (1, PARTITION)]
+
+
+def test_spread_splits_the_partition():
+    assert assign('spread', 0, PARTITION, 4) == [(0, (0, 1)), (2, (2, 3)), (4, (4, 5)), (6, (6, 7))]
+
+
+def test_spread_with_more_threads_than_places():
+    assignment = assign('spread', 0, (0, 1), 4)
+    assert [place for place, partition in assignment] == [0, 0, 1, 1]
+    assert all(partition == (place,) for place, partition in assignment)
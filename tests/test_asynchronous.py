@@ -0,0 +1,81 @@
+import asyncio
+
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+async def levels():
+    seen = []
+    async with OpenMP("parallel"):
+        with OpenMP("critical"):
+            seen.append((omp.get_level(), omp.get_active_level(), omp.get_ancestor_thread_num(0),
+                         omp.get_team_size(0), omp.get_team_size(1), omp.get_num_threads()))
+    return seen
+
+
+@omp.enable
+async def total(n):
+    result = 0
+    async with OpenMP("parallel for reduction(+:result)"):
+        for i in range(n):
+            result += i
+    return result
+
+
+def test_levels_on_the_hot_team():
+    omp.set_num_threads(3)
+    assert asyncio.run(levels()) == [(1, 1, 0, 1, 3, 3)] * 3
+
+
+def test_levels_of_a_serialized_region():
+    # Regions of a single thread are run by a thread standing for the encountering thread.
+    omp.set_num_threads(1)
+    try:
+        assert asyncio.run(levels()) == [(1, 0, 0, 1, 1, 1)]
+    finally:
+        omp.set_num_threads(3)
+
+
+def test_levels_of_a_region_on_a_new_team():
+    # While the hot team is busy, the region gets a team of its own, started by the stand-in thread.
+    omp.set_num_threads(3)
+    busy = omp.core.threading.hot_team.busy
+    busy.acquire()
+    try:
+        assert asyncio.run(levels()) == [(1, 1, 0, 1, 3, 3)] * 3
+    finally:
+        busy.release()
+
+
+def test_event_loop_runs_during_the_region():
+    omp.set_num_threads(3)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        results = await asyncio.gather(total(200000), total(1000))
+        task.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+    assert results == [sum(range(200000)), sum(range(1000))]
+    assert ticks > 1
+
+
+def test_async_with_rejects_other_constructs():
+    try:
+        @omp.enable
+        async def single():
+            async with OpenMP("single"):
+                pass
+    except SyntaxError:
+        return
+    raise AssertionError('The single construct was accepted in an async with statement.')
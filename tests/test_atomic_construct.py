@@ -0,0 +1,39 @@
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def atomic_updates(n):
+    count = 0
+    total = 0
+    with OpenMP("parallel for"):
+        for i in range(n):
+            with OpenMP("atomic"):
+                count += 1
+            with OpenMP("atomic update"):
+                total = total + i
+    return count, total
+
+
+def test_atomic_updates_are_not_lost():
+    omp.set_num_threads(4)
+    assert atomic_updates(2000) == (2000, sum(range(2000)))
+
+
+@omp.enable
+def atomic_capture(n):
+    counter = 0
+    seen = []
+    with OpenMP("parallel for"):
+        for i in range(n):
+            with OpenMP("atomic capture"):
+                counter += 1
+                value = counter
+            with OpenMP("critical"):
+                seen.append(value)
+    return sorted(seen)
+
+
+def test_atomic_captures_are_unique():
+    omp.set_num_threads(4)
+    assert atomic_capture(500) == list(range(1, 501))
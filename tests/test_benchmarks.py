@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+
+
+def run(script, *args):
+    return subprocess.run([sys.executable, os.path.join(BENCHMARKS, script), *args], capture_output=True, text=True,
+                          timeout=300, env={**os.environ, 'OMP_CACHE': '0'})
+
+
+def test_overheads_write_results(tmp_path):
+    path = tmp_path / 'results.json'
+    process = run('overheads.py', '--threads', '2', '--only', 'barrier', 'critical', '--repeat', '1',
+                  '--target', '0.001', '--output', str(path))
+    assert process.returncode == 0, process.stderr
+
+    results = json.loads(path.read_text())
+    assert {entry['name'] for entry in results['results']} == {'barrier', 'critical'}
+    assert all(entry['seconds'] > 0 for entry in results['results'])
+
+
+def write(path, seconds):
+    path.write_text(json.dumps({'suite': 'overheads', 'environment': {}, 'results': [
+        {'name': 'barrier', 'params': {'threads': 2}, 'seconds': seconds},
+    ]}))
+
+
+def test_compare_reports_regressions(tmp_path):
+    before, after = tmp_path / 'before.json', tmp_path / 'after.json'
+    write(before, 1e-5)
+
+    write(after, 1.05e-5)
+    assert run('compare.py', str(before), str(after)).returncode == 0
+
+    write(after, 2e-5)
+    process = run('compare.py', str(before), str(after))
+    assert process.returncode == 1
+    assert '1 regression(s) out of 1 measurement(s).' in process.stdout
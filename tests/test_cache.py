@@ -0,0 +1,97 @@
+import importlib
+import os
+import sys
+import textwrap
+
+import pytest
+
+import omp
+
+
+SOURCE = textwrap.dedent('''
+    import omp
+    from omp import OpenMP
+
+
+    @omp.enable
+    def total(n):
+        result = 0
+        with OpenMP("parallel for reduction(+:result)"):
+            for i in range(n):
+                result += i
+        return result
+''')
+
+
+EVALUATED_SOURCE = textwrap.dedent('''
+    import os
+
+    import omp
+    from omp import OpenMP
+
+    CHUNK = os.environ['TEST_CHUNK']
+
+
+    @omp.enable
+    def owners():
+        owners = []
+        with OpenMP(f"parallel for schedule(static, {CHUNK}) ordered"):
+            for i in range(4):
+                with OpenMP("ordered"):
+                    owners.append(omp.get_thread_num())
+        return owners
+''')
+
+
+@pytest.fixture
+def module(tmp_path, monkeypatch):
+    monkeypatch.setattr(omp.core.cache, 'enabled', True)
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'cached_module.py').write_text(SOURCE)
+
+    def load(source=None):
+        if source is not None:
+            (tmp_path / 'cached_module.py').write_text(source)
+        sys.modules.pop('cached_module', None)
+        importlib.invalidate_caches()
+        return importlib.import_module('cached_module')
+
+    yield load
+    sys.modules.pop('cached_module', None)
+
+
+def test_transformed_code_is_cached(module, monkeypatch):
+    first = module()
+    path = omp.core.cache.path(first.total)
+    assert os.path.exists(path)
+    assert first.total(100) == sum(range(100))
+
+    def transform(*args):
+        raise AssertionError('The cached code was not used.')
+
+    monkeypatch.setattr(omp.core.entry, 'transform', transform)
+    assert module().total(100) == sum(range(100))
+
+
+def test_stale_cache_is_not_used(module):
+    function = module().total
+    cache_key = omp.core.cache.key(function, 0, omp.get_schedule())
+    assert omp.core.cache.load(function, cache_key) is None
+    assert omp.core.cache.load(function, cache_key + b'\0') is None
+
+
+def test_cache_can_be_disabled(module, monkeypatch):
+    monkeypatch.setattr(omp.core.cache, 'enabled', False)
+    assert not os.path.exists(omp.core.cache.path(module().total))
+
+
+def test_evaluated_directives_are_not_cached(module, monkeypatch):
+    omp.set_num_threads(2)
+    monkeypatch.setenv('TEST_CHUNK', '1')
+    first = module(EVALUATED_SOURCE)
+    assert first.owners() == [0, 1, 0, 1]
+    assert not os.path.exists(omp.core.cache.path(first.owners))
+
+    monkeypatch.setenv('TEST_CHUNK', '4')
+    assert module().owners() == [0, 0, 0, 0]
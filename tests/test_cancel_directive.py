@@ -0,0 +1,76 @@
+import pytest
+
+import omp
+from omp import OpenMP
+from tests import run_in_thread
+
+
+@pytest.fixture
+def cancellation(monkeypatch):
+    monkeypatch.setattr(omp.core.primitives.InternalControlVariables, 'cancel_var', True)
+
+
+@omp.enable
+def first_match(items, target):
+    found = -1
+    checked = 0
+    with OpenMP("parallel for schedule(dynamic, 4)"):
+        for i in range(len(items)):
+            with OpenMP("atomic"):
+                checked += 1
+            if items[i] == target:
+                found = i
+                OpenMP("cancel for")
+    return found, checked
+
+
+def test_cancelled_loop_stops_early(cancellation):
+    omp.set_num_threads(4)
+    items = list(range(100000))
+    found, checked = first_match(items, 10)
+    assert found == 10
+    assert checked < len(items)
+
+
+@omp.enable
+def cancelled_region():
+    after = []
+    with OpenMP("parallel"):
+        if omp.get_thread_num() == 0:
+            OpenMP("cancel parallel")
+        OpenMP("barrier")
+        with OpenMP("critical"):
+            after.append(omp.get_thread_num())
+    return after
+
+
+def test_cancelled_region_is_left_at_the_next_barrier(cancellation):
+    omp.set_num_threads(4)
+    assert cancelled_region() == []
+
+
+def test_cancel_directives_have_no_effect_without_cancellation():
+    omp.set_num_threads(4)
+    assert sorted(cancelled_region()) == [0, 1, 2, 3]
+
+
+@omp.enable
+def cancelled_reduction(n, after):
+    total = 0
+    with OpenMP("parallel"):
+        with OpenMP("for reduction(+:total) schedule(static, 1)"):
+            for i in range(n):
+                if i == 1:
+                    OpenMP("cancel parallel")
+                total += i
+        with OpenMP("critical"):
+            after.append(omp.get_thread_num())
+    return total
+
+
+def test_cancelled_region_leaves_its_reductions(cancellation):
+    omp.set_num_threads(4)
+    after = []
+    # The threads combining their results with those of the cancelling thread leave the region instead.
+    assert run_in_thread(lambda: cancelled_reduction(40, after), 10)
+    assert after == []
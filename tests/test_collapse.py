@@ -0,0 +1,18 @@
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def collapsed(n, m):
+    pairs = []
+    with OpenMP("parallel for collapse(2) schedule(static, 3)"):
+        for i in range(n):
+            for j in range(m):
+                with OpenMP("critical"):
+                    pairs.append((i, j))
+    return sorted(pairs)
+
+
+def test_collapsed_loops_run_every_pair_once():
+    omp.set_num_threads(4)
+    assert collapsed(5, 7) == [(i, j) for i in range(5) for j in range(7)]
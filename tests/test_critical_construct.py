@@ -0,0 +1,27 @@
+import threading
+
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def named_critical_sections(entered, release):
+    inside = []
+    with OpenMP("parallel"):
+        if omp.get_thread_num() == 0:
+            with OpenMP("critical(first)"):
+                entered.set()
+                release.wait(10)
+                inside.append('first')
+        else:
+            entered.wait(10)
+            with OpenMP("critical(second)"):
+                inside.append('second')
+                release.set()
+    return inside
+
+
+def test_named_critical_sections_do_not_exclude_each_other():
+    omp.set_num_threads(2)
+    # The second section only releases the first one if it can enter it while the first one is held.
+    assert named_critical_sections(threading.Event(), threading.Event()) == ['second', 'first']
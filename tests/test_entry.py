@@ -0,0 +1,84 @@
+import omp
+from omp import OpenMP
+
+CHUNK = 1
+
+
+def decorate_for():
+    @omp.enable
+    def count(n):
+        total = 0
+        with OpenMP("parallel"):
+            with OpenMP("for reduction(+:total)"):
+                for i in range(n):
+                    total += 1
+        return total
+    return count
+
+
+def decorate_sections_for():
+    @omp.enable
+    def count(n):
+        total = 0
+        done = []
+        with OpenMP("parallel"):
+            with OpenMP("sections"):
+                with OpenMP("section"):
+                    done.append(0)
+                with OpenMP("section"):
+                    done.append(1)
+            with OpenMP("for reduction(+:total)"):
+                for i in range(n):
+                    total += 1
+        return total, sorted(done)
+    return count
+
+
+def decorate_collapse_for():
+    @omp.enable
+    def count(n):
+        total = 0
+        with OpenMP("parallel"):
+            with OpenMP("for collapse(2) reduction(+:total)"):
+                for i in range(n):
+                    for j in range(n):
+                        total += 1
+            with OpenMP("for reduction(+:total)"):
+                for i in range(n):
+                    total += 1
+        return total
+    return count
+
+
+def test_loops_are_shared_whatever_the_node_identities(monkeypatch):
+    # The worst case of the addresses of discarded nodes being reused by new nodes: all the nodes have the same one.
+    monkeypatch.setattr(omp.core.entry, 'id', lambda node: 0, raising=False)
+    omp.set_num_threads(3)
+    assert decorate_for()(50) == 50
+    assert decorate_sections_for()(50) == (50, [0, 1])
+    assert decorate_collapse_for()(5) == 30
+
+
+def test_redecorated_loops_are_shared():
+    # The loops of a region are run once overall, whatever the nodes discarded by the previous transformations.
+    omp.set_num_threads(3)
+    for _ in range(100):
+        assert decorate_for()(50) == 50
+        assert decorate_sections_for()(50) == (50, [0, 1])
+        assert decorate_collapse_for()(5) == 30
+
+
+def test_local_names_shadow_global_ones_in_directives():
+    omp.set_num_threads(2)
+    CHUNK = 4
+
+    @omp.enable
+    def owners():
+        owners = []
+        with OpenMP(f"parallel for schedule(static, {CHUNK}) ordered"):
+            for i in range(4):
+                with OpenMP("ordered"):
+                    owners.append(omp.get_thread_num())
+        return owners
+
+    assert owners() == [0, 0, 0, 0]
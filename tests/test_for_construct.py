@@ -0,0 +1,114 @@
+import pytest
+
+import omp
+from omp import OpenMP
+from omp.directives.for_construct import block, static_ranges
+from tests import run_in_thread
+
+
+RANGES = [
+    range(10),
+    range(2, 9, 3),
+    range(9, -1, -1),
+    range(8, -1, -2),
+    range(9, 0, -1),
+    range(-6, 0),
+    range(-10, 0, 3),
+    range(-1, -11, -1),
+    range(-2, -9, -2),
+]
+
+
+@pytest.mark.parametrize('values', RANGES, ids=str)
+@pytest.mark.parametrize('size', [1, 3, 4])
+@pytest.mark.parametrize('chunk', [None, 1, 2])
+def test_blocks_of_ranges_index_their_values(values, size, chunk):
+    items = list(range(100, 110))
+    blocks = [block(values, start, stop) for rank in range(size)
+              for start, stop in static_ranges(len(values), rank, size, chunk)]
+    assert sorted(sum((items[b] for b in blocks), [])) == sorted(items[v] for v in values)
+
+
+def test_chunked_loop_over_negative_range():
+    omp.set_num_threads(3)
+
+    @omp.enable
+    def blocks():
+        items = list(range(10))
+        seen = []
+        with OpenMP("parallel for chunked schedule(static)"):
+            for b in range(-6, 0):
+                with OpenMP("critical"):
+                    seen.append(items[b])
+        return sorted(seen)
+
+    assert blocks() == [[4, 5], [6, 7], [8, 9]]
+
+
+def test_chunked_static_loop_over_iterator_gives_contiguous_blocks():
+    omp.set_num_threads(3)
+
+    @omp.enable
+    def blocks():
+        seen = []
+        with OpenMP("parallel for chunked schedule(static)"):
+            for b in iter(range(8)):
+                with OpenMP("critical"):
+                    seen.append(b)
+        return sorted(seen)
+
+    assert blocks() == [(0, 1, 2), (3, 4, 5), (6, 7)]
+
+
+# The failed iteration and the aborted barrier waits end the worker threads with an exception.
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_ordered_loop_is_aborted_by_a_failed_iteration():
+    omp.set_num_threads(4)
+    done = []
+
+    @omp.enable
+    def failing(done):
+        with OpenMP("parallel for ordered schedule(static, 1)"):
+            for i in range(20):
+                if i == 3:
+                    raise ValueError(i)
+                with OpenMP("ordered"):
+                    done.append(i)
+
+    assert run_in_thread(lambda: failing(done), 10)
+    # The iterations before the failed one may not get their turn before the team is aborted.
+    assert done == list(range(len(done))) and len(done) <= 3
+
+
+def test_ordered_loop_is_left_when_the_region_is_cancelled(monkeypatch):
+    monkeypatch.setattr(omp.core.primitives.InternalControlVariables, 'cancel_var', True)
+    omp.set_num_threads(4)
+    done = []
+
+    @omp.enable
+    def cancelled(done):
+        with OpenMP("parallel for ordered schedule(static, 1)"):
+            for i in range(20):
+                if i == 3:
+                    OpenMP("cancel parallel")
+                with OpenMP("ordered"):
+                    done.append(i)
+
+    assert run_in_thread(lambda: cancelled(done), 10)
+    # The iterations before the cancelling one may not get their turn before the region is cancelled.
+    assert done == list(range(len(done))) and len(done) <= 3
+
+
+def test_ordered_blocks_run_in_order():
+    omp.set_num_threads(4)
+
+    @omp.enable
+    def ordered():
+        done = []
+        with OpenMP("parallel for ordered schedule(dynamic)"):
+            for i in range(200):
+                with OpenMP("ordered"):
+                    done.append(i)
+        return done
+
+    assert ordered() == list(range(200))
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+import omp
+from omp import OpenMP
+from omp.core.interpreters import MESSAGE, _coordinate
+from omp.core.processes import RemoteTraceback
+
+
+@pytest.fixture
+def interpreter_backend():
+    if not omp.core.interpreters.available:
+        pytest.skip('The interpreter backend requires Python 3.12 or later.')
+    omp.set_backend('interpreter')
+    omp.set_num_threads(3)
+    yield
+    omp.set_backend('thread')
+
+
+@omp.enable
+def total(n):
+    result = 0
+    with OpenMP("parallel for reduction(+:result)"):
+        for i in range(n):
+            result += i
+    return result
+
+
+@omp.enable
+def temporaries(n):
+    result = 0
+    with OpenMP("parallel"):
+        offset = omp.get_thread_num() * 0
+        with OpenMP("for reduction(+:result)"):
+            for i in range(n):
+                double = 2 * i
+                result += double + offset
+    return result
+
+
+@omp.enable
+def assigning():
+    shared = 0
+    with OpenMP("parallel"):
+        shared = 1
+    return shared
+
+
+@omp.enable
+def failing():
+    with OpenMP("parallel"):
+        if omp.get_thread_num() == 1:
+            raise ValueError('member failed')
+        OpenMP("barrier")
+
+
+def test_reductions_are_combined(interpreter_backend):
+    assert total(100) == sum(range(100))
+
+
+def test_variables_first_assigned_in_the_region_are_private(interpreter_backend):
+    assert temporaries(100) == 2 * sum(range(100))
+
+
+def test_assigned_shared_variables_are_reported(interpreter_backend):
+    with pytest.raises(RuntimeError, match='assigned shared'):
+        assigning()
+
+
+def test_member_error_is_raised_in_the_parent(interpreter_backend, capfd):
+    with pytest.raises(RuntimeError, match='interpreter 1') as info:
+        failing()
+
+    assert isinstance(info.value.__cause__, RemoteTraceback)
+    assert "ValueError: member failed" in info.value.__cause__.text
+    assert capfd.readouterr().out == ''
+
+
+def test_members_waiting_for_a_done_member_are_released():
+    arrivals, arrivals_write = os.pipe()
+    releases = [os.pipe() for _ in range(3)]
+    # Member 2 is done without arriving at the barrier, as when it cannot rebuild the region.
+    for kind, rank in [(b'a', 0), (b'd', 2), (b'a', 1), (b'd', 0), (b'd', 1)]:
+        os.write(arrivals_write, MESSAGE.pack(kind, rank))
+
+    _coordinate(3, arrivals, [write for read, write in releases])
+
+    for read, write in releases[:2]:
+        os.set_blocking(read, False)
+        assert os.read(read, 1) == b'x'
+    for fd in [arrivals, arrivals_write, *sum(releases, ())]:
+        os.close(fd)
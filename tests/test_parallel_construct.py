@@ -0,0 +1,55 @@
+import threading
+
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def region_threads():
+    threads = []
+    with OpenMP("parallel"):
+        with OpenMP("critical"):
+            threads.append(threading.current_thread())
+    return threads
+
+
+def test_hot_team_is_reused_across_regions():
+    omp.set_num_threads(4)
+    first = region_threads()
+    second = region_threads()
+    assert len(set(first)) == 4
+    assert set(first) == set(second)
+    assert all(isinstance(thread, omp.core.threading.Worker) for thread in first)
+
+
+def test_hot_team_is_resized():
+    omp.set_num_threads(2)
+    assert len(set(region_threads())) == 2
+    omp.set_num_threads(5)
+    assert len(set(region_threads())) == 5
+
+
+@omp.enable
+def nested_sizes():
+    sizes = []
+    with OpenMP("parallel"):
+        omp.set_num_threads(3)
+        with OpenMP("parallel"):
+            with OpenMP("critical"):
+                sizes.append((omp.get_level(), omp.get_active_level(), omp.get_num_threads()))
+    return sorted(sizes)
+
+
+def test_nested_regions_are_serialized_by_default():
+    omp.set_num_threads(2)
+    omp.set_max_active_levels(1)
+    assert nested_sizes() == [(2, 1, 1)] * 2
+
+
+def test_nested_regions_get_teams_with_more_active_levels():
+    omp.set_num_threads(2)
+    omp.set_max_active_levels(2)
+    try:
+        assert nested_sizes() == [(2, 2, 3)] * 6
+    finally:
+        omp.set_max_active_levels(1)
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import omp
+from omp import OpenMP
+
+
+def numbers(n):
+    # A generator, which cannot be indexed.
+    yield from range(n)
+
+
+@omp.enable
+def prefetched(items):
+    seen = []
+    with OpenMP("parallel for schedule(dynamic, 4) prefetch(2)"):
+        for item in items:
+            with OpenMP("critical"):
+                seen.append(item)
+    return sorted(seen)
+
+
+def test_prefetched_loop_runs_every_iteration_once():
+    omp.set_num_threads(4)
+    assert prefetched(numbers(300)) == list(range(300))
+
+
+def slow_numbers(n, pulled):
+    for i in range(n):
+        pulled.append(threading.current_thread())
+        yield i
+
+
+def test_prefetched_elements_are_pulled_by_a_producer_thread():
+    omp.set_num_threads(4)
+    pulled = []
+    assert prefetched(slow_numbers(50, pulled)) == list(range(50))
+    assert len(pulled) == 50
+    assert not any(isinstance(thread, omp.core.threading.Worker) for thread in pulled)
+
+
+def stalled_numbers(n, resume):
+    # Pulling the second half of the elements waits for the threads to have run the first half.
+    for i in range(n):
+        if i == n // 2:
+            resume.wait(2)
+        yield i
+
+
+@omp.enable
+def joined_in_time(items, shared):
+    in_time = []
+    with OpenMP("parallel"):
+        # The other threads reach the loop once the producer is pulling from the iterator.
+        if omp.get_thread_num() != 0:
+            time.sleep(0.2)
+        with OpenMP("for schedule(dynamic, 1) prefetch(8)"):
+            for item in items:
+                with OpenMP("critical"):
+                    if omp.get_thread_num() != 0:
+                        shared.set()
+                in_time.append(shared.wait(2))
+    return in_time
+
+
+def test_threads_take_prefetched_chunks_while_the_producer_pulls():
+    omp.set_num_threads(4)
+    shared = threading.Event()
+    # The producer is stuck in the iterator until another thread than the first one ran an iteration.
+    assert all(joined_in_time(stalled_numbers(8, shared), shared))
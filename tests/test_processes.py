@@ -0,0 +1,72 @@
+import pytest
+
+import omp
+from omp import OpenMP
+from omp.core.processes import RemoteTraceback
+
+
+@pytest.fixture
+def process_backend():
+    omp.set_backend('process')
+    omp.set_num_threads(3)
+    yield
+    omp.set_backend('thread')
+
+
+@omp.enable
+def total(n):
+    result = 0
+    with OpenMP("parallel for reduction(+:result)"):
+        for i in range(n):
+            result += i
+    return result
+
+
+@omp.enable
+def temporaries(n):
+    result = 0
+    with OpenMP("parallel"):
+        offset = omp.get_thread_num() * 0
+        with OpenMP("for reduction(+:result)"):
+            for i in range(n):
+                double = 2 * i
+                result += double + offset
+    return result
+
+
+@omp.enable
+def assigning():
+    shared = 0
+    with OpenMP("parallel"):
+        shared = 1
+    return shared
+
+
+@omp.enable
+def failing():
+    with OpenMP("parallel"):
+        if omp.get_thread_num() == 1:
+            raise ValueError('member failed')
+        OpenMP("barrier")
+
+
+def test_reductions_are_combined(process_backend):
+    assert total(100) == sum(range(100))
+
+
+def test_variables_first_assigned_in_the_region_are_private(process_backend):
+    assert temporaries(100) == 2 * sum(range(100))
+
+
+def test_assigned_shared_variables_are_reported(process_backend):
+    with pytest.raises(RuntimeError, match='assigned shared'):
+        assigning()
+
+
+def test_member_error_is_raised_in_the_parent(process_backend, capfd):
+    with pytest.raises(RuntimeError, match='process 1') as info:
+        failing()
+
+    assert isinstance(info.value.__cause__, RemoteTraceback)
+    assert "ValueError: member failed" in info.value.__cause__.text
+    assert capfd.readouterr().out == ''
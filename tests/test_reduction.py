@@ -0,0 +1,92 @@
+import collections
+import threading
+
+import pytest
+
+import omp
+from omp import OpenMP
+from tests import run_in_thread
+
+
+@omp.enable
+def reductions(values):
+    total = 0
+    product = 1
+    smallest = 0
+    largest = 0
+    every = True
+    with OpenMP("parallel for reduction(+:total) reduction(*:product) reduction(min:smallest) reduction(max:largest) "
+                "reduction(&&:every)"):
+        for value in values:
+            total += value
+            product *= value
+            smallest = min(smallest, value)
+            largest = max(largest, value)
+            every = every and value > 0
+    return total, product, smallest, largest, every
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 4, 7])
+def test_reductions_combine_every_thread(size):
+    omp.set_num_threads(size)
+    values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    assert reductions(values) == (sum(values), 486000, 0, 9, True)
+
+
+omp.declare_reduction('merge', lambda a, b: a + b, collections.Counter)
+
+
+@omp.enable
+def word_counts(words):
+    counts = collections.Counter()
+    with OpenMP("parallel for reduction(merge:counts)"):
+        for word in words:
+            counts[word] += 1
+    return counts
+
+
+def test_declared_reductions():
+    omp.set_num_threads(4)
+    words = ['a', 'b', 'a', 'c', 'b', 'a'] * 50
+    assert word_counts(words) == collections.Counter(words)
+
+
+omp.declare_reduction('concat', lambda a, b: a + b, list)
+
+
+@omp.enable
+def concatenated(n):
+    order = []
+    with OpenMP("parallel for reduction(concat:order) schedule(static)"):
+        for i in range(n):
+            order += [i]
+    return order
+
+
+@pytest.mark.parametrize('size', [2, 3, 5])
+def test_partial_results_are_combined_in_rank_order(size):
+    omp.set_num_threads(size)
+    # List concatenation is not commutative: the static blocks are only joined back in order if the threads are.
+    assert concatenated(40) == list(range(40))
+
+
+@omp.enable
+def failing_reduction(n):
+    total = 0
+    with OpenMP("parallel for reduction(+:total)"):
+        for i in range(n):
+            if i == 3:
+                raise ValueError(i)
+            total += i
+    return total
+
+
+def test_failed_iteration_aborts_the_reduction(monkeypatch):
+    omp.set_num_threads(4)
+    errors = []
+    monkeypatch.setattr(threading, 'excepthook', lambda args: errors.append(args.exc_type))
+
+    # The threads waiting for the results of the failed thread leave the loop instead of waiting forever.
+    assert run_in_thread(lambda: failing_reduction(40), 10)
+    assert ValueError in errors
+    assert set(errors) <= {ValueError, threading.BrokenBarrierError}
@@ -0,0 +1,67 @@
+import pytest
+
+import omp
+from omp import OpenMP
+from omp.core.primitives import parse_schedule
+from omp.directives.for_construct import guided_ranges, static_ranges
+
+
+@pytest.mark.parametrize('size', [1, 3, 4, 7])
+@pytest.mark.parametrize('chunk', [None, 1, 3])
+def test_static_ranges_partition_the_iterations(size, chunk):
+    ranges = [list(static_ranges(23, rank, size, chunk)) for rank in range(size)]
+    positions = sorted(position for thread in ranges for start, stop in thread for position in range(start, stop))
+    assert positions == list(range(23))
+    if chunk is None:
+        # Each thread gets a single block, no longer than another one by more than an iteration.
+        lengths = [stop - start for (start, stop), in ranges]
+        assert max(lengths) - min(lengths) <= 1
+
+
+def test_guided_chunks_shrink():
+    ranges = guided_ranges(1000, 4, 5)
+    lengths = [stop - start for start, stop in ranges]
+    assert [start for start, stop in ranges] == [0] + [stop for start, stop in ranges[:-1]]
+    assert ranges[-1][1] == 1000
+    assert lengths == sorted(lengths, reverse=True)
+    assert lengths[0] == 250
+    assert min(lengths[:-1]) >= 5
+
+
+def numbers(n):
+    # A generator, which cannot be indexed.
+    yield from range(n)
+
+
+def numbers_list(n):
+    return list(range(n))
+
+
+SCHEDULES = ['static', 'static,7', 'dynamic', 'dynamic,7', 'guided', 'guided,7']
+
+
+# Static schedules walk the iterable in every thread, so they need iterables which can be walked several times.
+@pytest.mark.parametrize('schedule, items',
+                         [(schedule, items) for schedule in SCHEDULES for items in (range, numbers_list)]
+                         + [(schedule, numbers) for schedule in SCHEDULES if not schedule.startswith('static')],
+                         ids=lambda value: getattr(value, '__name__', value))
+def test_schedules_run_every_iteration_once(schedule, items):
+    omp.set_num_threads(4)
+    runtime = omp.get_schedule()
+    omp.set_schedule(*parse_schedule(schedule))
+    try:
+        # The runtime schedule is resolved when the function is enabled.
+        @omp.enable
+        def scheduled_sum(items):
+            total = 0
+            seen = []
+            with OpenMP("parallel for reduction(+:total) schedule(runtime)"):
+                for item in items:
+                    total += item
+                    with OpenMP("critical"):
+                        seen.append(item)
+            return total, sorted(seen)
+    finally:
+        omp.set_schedule(*runtime)
+
+    assert scheduled_sum(items(500)) == (sum(range(500)), list(range(500)))
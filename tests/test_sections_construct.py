@@ -0,0 +1,20 @@
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def sections():
+    ran = []
+    with OpenMP("parallel sections"):
+        with OpenMP("section"):
+            ran.append(('a', omp.get_thread_num()))
+        with OpenMP("section"):
+            ran.append(('b', omp.get_thread_num()))
+        with OpenMP("section"):
+            ran.append(('c', omp.get_thread_num()))
+    return ran
+
+
+def test_sections_run_once_each():
+    omp.set_num_threads(3)
+    assert sorted(name for name, rank in sections()) == ['a', 'b', 'c']
@@ -0,0 +1,22 @@
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def single_then_barrier():
+    runs = []
+    seen = []
+    with OpenMP("parallel"):
+        with OpenMP("single"):
+            runs.append(omp.get_thread_num())
+        # The implicit barrier of single makes its result visible to all the threads.
+        with OpenMP("critical"):
+            seen.append(len(runs))
+    return runs, seen
+
+
+def test_single_runs_once_before_the_other_threads_continue():
+    omp.set_num_threads(4)
+    runs, seen = single_then_barrier()
+    assert len(runs) == 1
+    assert seen == [1] * 4
@@ -0,0 +1,53 @@
+import omp
+from omp import OpenMP
+
+
+def fibonacci_sequential(n):
+    return n if n < 2 else fibonacci_sequential(n - 1) + fibonacci_sequential(n - 2)
+
+
+@omp.enable
+def fibonacci(n):
+    if n < 2:
+        return n
+    a = b = 0
+    with OpenMP("task"):
+        a = fibonacci(n - 1)
+    with OpenMP("task"):
+        b = fibonacci(n - 2)
+    OpenMP("taskwait")
+    return a + b
+
+
+@omp.enable
+def parallel_fibonacci(n):
+    result = 0
+    with OpenMP("parallel"):
+        with OpenMP("single"):
+            result = fibonacci(n)
+    return result
+
+
+def test_tasks_are_waited_for():
+    omp.set_num_threads(4)
+    assert parallel_fibonacci(12) == fibonacci_sequential(12)
+
+
+@omp.enable
+def task_group(n):
+    done = []
+    with OpenMP("parallel"):
+        with OpenMP("single"):
+            with OpenMP("taskgroup"):
+                for i in range(n):
+                    with OpenMP("task"):
+                        with OpenMP("critical"):
+                            done.append(i)
+            # The tasks of the group are completed at its end.
+            count = len(done)
+    return count, sorted(done)
+
+
+def test_taskgroup_waits_for_its_tasks():
+    omp.set_num_threads(4)
+    assert task_group(50) == (50, list(range(50)))
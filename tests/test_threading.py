@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+import omp
+from omp.core.threading import Team, counter
+
+
+class SlowDeques(list):
+
+    """
+    Deques whose check by sleeping threads takes a while, widening the window between their check of the barrier
+    epoch and their going to sleep.
+    """
+
+    def __iter__(self):
+        time.sleep(0.05)
+        return super().__iter__()
+
+
+def run_team(size, target):
+    """
+    Run the given function on a new team, and return whether all its threads completed it in time.
+    """
+    team = Team(size=size, target=target, daemon=True)
+    team.deques = SlowDeques(team.deques)
+    team.start()
+    for thread in team.threads:
+        thread.join(timeout=5)
+    return not any(thread.is_alive() for thread in team.threads)
+
+
+def test_barrier_wakes_up_threads_going_to_sleep(monkeypatch):
+    monkeypatch.setattr(omp.core.primitives.InternalControlVariables, 'wait_policy_var', 'passive')
+
+    def target():
+        thread = threading.current_thread()
+        if thread.rank == 1:
+            # Arrive last while the first thread is going to sleep.
+            time.sleep(0.01)
+        thread.team.barrier.wait()
+
+    assert run_team(2, target)
+
+
+def test_barrier_epochs(monkeypatch):
+    monkeypatch.setattr(omp.core.primitives.InternalControlVariables, 'wait_policy_var', 'passive')
+    arrivals = []
+    early = []
+
+    def target():
+        barrier = threading.current_thread().team.barrier
+        for epoch in range(200):
+            arrivals.append(epoch)
+            barrier.wait()
+            # No thread leaves the barrier before all the threads arrived.
+            if arrivals.count(epoch) != 4:
+                early.append(epoch)
+
+    team = Team(size=4, target=target, daemon=True)
+    team.start()
+    for thread in team.threads:
+        thread.join(timeout=30)
+    assert not any(thread.is_alive() for thread in team.threads)
+    assert len(arrivals) == 800
+    assert not early
+
+
+@pytest.mark.parametrize('gil', [True, False])
+def test_counter_hands_out_each_number_once(monkeypatch, gil):
+    # Without the GIL, the counter is a locked one.
+    monkeypatch.setattr(omp.core.threading, 'GIL_ENABLED', gil)
+    numbers = counter(0, 3)
+    taken = [[] for _ in range(4)]
+
+    def take(mine):
+        for _ in range(5000):
+            mine.append(next(numbers))
+
+    threads = [threading.Thread(target=take, args=(mine,)) for mine in taken]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(sum(taken, [])) == list(range(0, 3 * 20000, 3))
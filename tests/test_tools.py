@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+import omp
+from omp import OpenMP
+
+
+@omp.enable
+def loop(n):
+    total = 0
+    with OpenMP("parallel for reduction(+:total) schedule(dynamic, 10)"):
+        for i in range(n):
+            total += i
+    return total
+
+
+@pytest.fixture
+def recorded():
+    events = []
+
+    def record(event, **info):
+        events.append((event, info))
+
+    for event in omp.core.tools.events:
+        omp.register_callback(event, record)
+    yield events
+    for event in omp.core.tools.events:
+        omp.unregister_callback(event, record)
+
+
+def test_callbacks_receive_the_events_of_a_region(recorded):
+    omp.set_num_threads(3)
+    assert loop(100) == sum(range(100))
+
+    names = [event for event, info in recorded]
+    assert names.count('parallel_begin') == names.count('parallel_end') == 1
+    assert names.count('implicit_task_begin') == names.count('implicit_task_end') == 3
+    dispatched = [info for event, info in recorded if event == 'dispatch']
+    assert sorted(info['start'] for info in dispatched) == list(range(0, 100, 10))
+    assert sum(info['iterations'] for info in dispatched) == 100
+
+
+def test_events_are_skipped_once_the_callbacks_are_unregistered():
+    events = []
+
+    def record(event, **info):
+        events.append(event)
+
+    omp.register_callback('dispatch', record)
+    assert omp.core.tools.enabled
+    omp.unregister_callback('dispatch', record)
+    assert not omp.core.tools.enabled
+
+    loop(10)
+    assert events == []
+
+
+def test_unknown_events_are_rejected():
+    with pytest.raises(ValueError):
+        omp.register_callback('unknown', print)
+
+
+def test_profiler_exports_a_trace(tmp_path):
+    omp.set_num_threads(2)
+    with omp.Profiler() as profiler:
+        loop(100)
+
+    assert not omp.core.tools.enabled
+    stats = profiler.stats()
+    assert sum(thread['iterations'] for thread in stats.values()) == 100
+
+    path = tmp_path / 'trace.json'
+    profiler.write_trace(str(path))
+    trace = json.loads(path.read_text())
+    assert trace['traceEvents']